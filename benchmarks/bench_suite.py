@@ -0,0 +1,343 @@
+"""
+    Headless benchmark suite of the viewer on synthetic documents.
+
+    Documents: many pages, text dense, vector heavy, image heavy, link dense and deep TOC,
+    generated in a temporary directory. Each benchmark reports its run times, the peak of
+    the Python heap (tracemalloc) and the peak resident size of the process.
+    Caches on disk are redirected to the temporary directory and the render is measured cold.
+
+    Usage: python benchmarks/bench_suite.py [--scale S] [--repeat N] [--only NAME ...] [--output results.json]
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Keep the search index, thumbnails and render disk cache out of the user cache
+TEMP_DIR = tempfile.mkdtemp(prefix="pymupdf_qt_viewer_bench_")
+atexit.register(shutil.rmtree, TEMP_DIR, ignore_errors=True)
+os.environ["XDG_CACHE_HOME"] = os.path.join(TEMP_DIR, "cache")
+
+import pymupdf
+
+from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR, QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication
+
+from pymupdf_qt_viewer.pymupdfviewer import (PdfViewer, SearchModel, LinkModel, OutlineModel,
+                                             PageNavigator, PageLabels)
+
+
+ZOOM_FACTORS = (0.5, 1.0, 2.0, 4.0)
+LOREM = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
+         "incididunt ut labore et dolore magna aliqua. ")
+
+
+def createManyPages(scale: float) -> pymupdf.Document:
+    """Short text pages, with roman then decimal page labels"""
+    doc = pymupdf.Document()
+    for i in range(int(2000 * scale)):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i} of the many pages document", fontsize=11)
+    doc.set_page_labels([{"startpage": 0, "prefix": "", "style": "r", "firstpagenum": 1},
+                         {"startpage": 10, "prefix": "", "style": "D", "firstpagenum": 1}])
+    return doc
+
+
+def createTextDense(scale: float) -> pymupdf.Document:
+    doc = pymupdf.Document()
+    for _ in range(int(40 * scale)):
+        page = doc.new_page()
+        page.insert_textbox(page.rect + (20, 20, -20, -20), LOREM * 120, fontsize=5)
+    return doc
+
+
+def createVectorHeavy(scale: float) -> pymupdf.Document:
+    """A3 drawing pages made of many thin lines and curves"""
+    doc = pymupdf.Document()
+    for p in range(4):
+        page = doc.new_page(width=1191, height=842)
+        shape = page.new_shape()
+        for i in range(int(10000 * scale)):
+            x, y = (i * 37 + p) % 1191, (i * 53) % 842
+            if i % 4 == 0:
+                shape.draw_bezier((x, y), (x + 40, y - 30), (x + 80, y + 30), (x + 120, y))
+            else:
+                shape.draw_line((x, y), ((x * 7) % 1191, (y * 3) % 842))
+        shape.finish(width=0.2)
+        shape.commit()
+    return doc
+
+
+def createImageHeavy(scale: float) -> pymupdf.Document:
+    doc = pymupdf.Document()
+    side = 1600
+    row = bytes((x * 7) % 256 for x in range(side * 3))
+    for p in range(max(1, int(8 * scale))):
+        samples = b"".join(row[(y + p) % 64:] + row[:(y + p) % 64] for y in range(side))
+        pix = pymupdf.Pixmap(pymupdf.csRGB, side, side, samples, 0)
+        page = doc.new_page()
+        page.insert_image(page.rect + (36, 36, -36, -36), pixmap=pix)
+    return doc
+
+
+def createLinkDense(scale: float) -> pymupdf.Document:
+    doc = pymupdf.Document()
+    page_count = int(300 * scale)
+    for _ in range(page_count):
+        doc.new_page()
+    for pno in range(page_count):
+        page = doc[pno]
+        for i in range(50):
+            rect = pymupdf.Rect(72, 40 + 15 * i, 300, 52 + 15 * i)
+            page.insert_text(rect.bl + (0, -2), f"See page {(pno + i) % page_count + 1}", fontsize=9)
+            page.insert_link({"kind": pymupdf.LINK_GOTO, "from": rect, "page": (pno + i) % page_count,
+                              "to": pymupdf.Point(72, 72), "zoom": 0})
+    return doc
+
+
+def createDeepToc(scale: float) -> pymupdf.Document:
+    """Chapters of 12 nested levels"""
+    doc = pymupdf.Document()
+    page_count = int(500 * scale)
+    for _ in range(page_count):
+        doc.new_page()
+    toc = []
+    for chapter in range(int(1500 * scale)):
+        for level in range(1, 13):
+            toc.append([level, f"Section {chapter}" + ".1" * (level - 1), chapter % page_count + 1])
+    doc.set_toc(toc)
+    return doc
+
+
+DOCUMENTS = {
+    "many_pages": createManyPages,
+    "text_dense": createTextDense,
+    "vector_heavy": createVectorHeavy,
+    "image_heavy": createImageHeavy,
+    "link_dense": createLinkDense,
+    "deep_toc": createDeepToc,
+}
+
+
+def maxRss() -> int | None:
+    """Peak resident size of the process in bytes"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def waitFor(predicate, timeout: float = 120.0):
+    app = QApplication.instance()
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark did not complete")
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def measure(name: str, document: str, func, repeat: int, setup=None, **params) -> dict:
+    """Run setup() then func() repeat times, time func only"""
+    times = []
+    tracemalloc.start()
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {"benchmark": name,
+              "document": document,
+              "params": params,
+              "times": times,
+              "best": min(times),
+              "median": statistics.median(times),
+              "peak_python_bytes": peak,
+              "max_rss_bytes": maxRss()}
+    param_text = " ".join(f"{key}={value}" for key, value in params.items())
+    print(f"{document:>13} {name:<28} {param_text:<12} best {result['best'] * 1000:>10.2f} ms  "
+          f"median {result['median'] * 1000:>10.2f} ms  py peak {peak / 2**20:>8.1f} MiB", file=sys.stderr)
+    return result
+
+
+def benchLoad(document: str, path: str, repeat: int) -> list[dict]:
+    viewers = []
+
+    def dispose():
+        """Stop and delete the previous viewer so that its workers do not run during the next measure"""
+        while viewers:
+            viewer = viewers.pop()
+            viewer.pdfview.render_scheduler.stop()
+            viewer.thumbnail_model.stop()
+            viewer.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+    def newViewer():
+        dispose()
+        viewer = PdfViewer()
+        viewer.resize(1200, 900)
+        viewer.pdfview.render_scheduler.diskCache().setEnabled(False)
+        viewers.append(viewer)
+
+    def load():
+        viewers[-1].loadDocument(path)
+
+    def firstPage():
+        load()
+        waitFor(lambda: viewers[-1].pdfview._shown_job is not None)
+
+    results = [measure("loadDocument", document, load, repeat, setup=newViewer),
+               measure("loadDocument+first_page", document, firstPage, repeat, setup=newViewer)]
+    dispose()
+    return results
+
+
+def benchRender(document: str, path: str, repeat: int) -> list[dict]:
+    viewer = PdfViewer()
+    viewer.resize(1200, 900)
+    viewer.show()
+    viewer.loadDocument(path)
+    view = viewer.pdfview
+    view.render_scheduler.diskCache().setEnabled(False)
+    view.setPrefetchDepth(0)
+    waitFor(lambda: view._shown_job is not None)
+
+    def clearCaches():
+        view.page_cache.clear()
+        view.tile_cache.clear()
+        view.render_scheduler.displayListCache().clear()
+        view._shown_job = None
+
+    def idle() -> bool:
+        return view._shown_job is not None and view._rendering is None and not view._pending_tiles
+
+    results = []
+    for zoom in ZOOM_FACTORS:
+        def render():
+            view.zoomSelector().zoomFactor = zoom
+            view.renderPage(0)
+            waitFor(idle)
+        results.append(measure("renderPage", document, render, repeat, setup=clearCaches, zoom=zoom))
+
+    dlist = view.fitzdoc[0].get_displaylist()
+    for zoom in ZOOM_FACTORS:
+        fitzpix = dlist.get_pixmap(alpha=0, matrix=pymupdf.Matrix(zoom, zoom))
+        results.append(measure("toQPixmap", document, lambda: view.toQPixmap(fitzpix), repeat, zoom=zoom))
+
+    view.render_scheduler.stop()
+    viewer.thumbnail_model.stop()
+    return results
+
+
+def benchSearch(document: str, path: str, repeat: int) -> list[dict]:
+    doc = pymupdf.Document(path)
+    model = SearchModel()
+    model.setIndexEnabled(False)
+    model.setDocument(doc, path)
+
+    def search():
+        model.searchFor("page", 0)
+        waitFor(lambda: not model.isSearching())
+
+    return [measure("SearchModel.searchFor", document, search, repeat, workers=SearchModel.max_workers)]
+
+
+def benchLinks(document: str, path: str, repeat: int) -> list[dict]:
+    doc = pymupdf.Document(path)
+    model = LinkModel()
+
+    def setup():
+        model.setDocument(doc)
+        model.setupModelData()
+
+    return [measure("LinkModel.setupModelData", document, setup, repeat)]
+
+
+def benchPageLabels(document: str, path: str, repeat: int) -> list[dict]:
+    doc = pymupdf.Document(path)
+    navigator = PageNavigator()
+
+    def labels():
+        page_labels = PageLabels(doc)
+        for pno in range(doc.page_count):
+            page_labels.pno(page_labels.label(pno))
+
+    return [measure("PageNavigator.setDocument", document, lambda: navigator.setDocument(doc), repeat),
+            measure("PageLabels.label+pno", document, labels, repeat)]
+
+
+def benchOutline(document: str, path: str, repeat: int) -> list[dict]:
+    doc = pymupdf.Document(path)
+    model = OutlineModel()
+    return [measure("OutlineModel.setDocument", document, lambda: model.setDocument(doc), repeat)]
+
+
+BENCHMARKS = {
+    "many_pages": (benchLoad, benchRender, benchSearch, benchPageLabels),
+    "text_dense": (benchLoad, benchRender, benchSearch),
+    "vector_heavy": (benchLoad, benchRender),
+    "image_heavy": (benchLoad, benchRender),
+    "link_dense": (benchLoad, benchLinks),
+    "deep_toc": (benchLoad, benchOutline),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0, help="size factor of the synthetic documents")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", choices=list(DOCUMENTS), default=list(DOCUMENTS))
+    parser.add_argument("--output", default="", help="JSON file, stdout when empty")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    results = []
+    for document in args.only:
+        t0 = time.perf_counter()
+        path = os.path.join(TEMP_DIR, f"{document}.pdf")
+        DOCUMENTS[document](args.scale).save(path, garbage=1, deflate=True)
+        print(f"{document:>13} generated in {time.perf_counter() - t0:.1f} s, "
+              f"{os.path.getsize(path) / 2**20:.1f} MiB", file=sys.stderr)
+
+        for bench in BENCHMARKS[document]:
+            results.extend(bench(document, path, args.repeat))
+
+    report = {"meta": {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                       "python": platform.python_version(),
+                       "platform": platform.platform(),
+                       "pymupdf": pymupdf.VersionBind,
+                       "pyqt": PYQT_VERSION_STR,
+                       "qt": QT_VERSION_STR,
+                       "cpu_count": os.cpu_count(),
+                       "scale": args.scale,
+                       "repeat": args.repeat},
+              "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+    Compare the pymupdf.Pixmap -> QPixmap conversion paths.
+
+    png: Pixmap.tobytes() + QPixmap.loadFromData() (previous implementation)
+    raw: toQImage() wrapping Pixmap.samples_mv + QPixmap.fromImage()
+
+    Usage: python benchmarks/bench_toqpixmap.py [pdf] [--repeat N]
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pymupdf
+
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from pymupdf_qt_viewer.pymupdfviewer import toQImage
+
+
+ZOOM_FACTORS = (1.0, 2.0, 4.0)
+
+
+def createDrawing() -> pymupdf.Document:
+    """Create an in-memory A3 page with dense vector content and text"""
+    doc = pymupdf.Document()
+    page = doc.new_page(width=1191, height=842)
+    shape = page.new_shape()
+    for x in range(0, 1191, 6):
+        shape.draw_line((x, 0), (1191 - x, 842))
+    shape.finish(width=0.2)
+    shape.commit()
+    for y in range(20, 842, 12):
+        page.insert_text((20, y), "Dense engineering drawing annotation 0123456789 " * 4, fontsize=6)
+    return doc
+
+
+def pngPath(fitzpix: pymupdf.Pixmap) -> QPixmap:
+    pixmap = QPixmap()
+    pixmap.loadFromData(fitzpix.tobytes())
+    return pixmap
+
+
+def rawPath(fitzpix: pymupdf.Pixmap) -> QPixmap:
+    return QPixmap.fromImage(toQImage(fitzpix))
+
+
+def timeit(func, fitzpix: pymupdf.Pixmap, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(fitzpix)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pdf", nargs="?", default="")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    doc = pymupdf.Document(args.pdf) if args.pdf else createDrawing()
+    dlist = doc[0].get_displaylist()
+
+    print(f"{'zoom':>6} {'size':>12} {'png (ms)':>10} {'raw (ms)':>10} {'speedup':>8}")
+    for zf in ZOOM_FACTORS:
+        fitzpix = dlist.get_pixmap(alpha=0, matrix=pymupdf.Matrix(zf, zf))
+        png = timeit(pngPath, fitzpix, args.repeat)
+        raw = timeit(rawPath, fitzpix, args.repeat)
+        size = f"{fitzpix.width}x{fitzpix.height}"
+        print(f"{zf:>6.1f} {size:>12} {png * 1000:>10.1f} {raw * 1000:>10.1f} {png / raw:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,119 @@
+import io
+import os
+import json
+import math
+import mmap
+import time
+import atexit
+import bisect
+import zlib
+import queue
+import struct
+import sqlite3
+import hashlib
 import pymupdf
+import numpy as np
 import logging
+import itertools
+import threading
+import multiprocessing
+import concurrent.futures
 
 from enum import Enum
-from dataclasses import dataclass, InitVar
+from contextlib import closing, contextmanager
+from collections import OrderedDict
+from dataclasses import dataclass, InitVar, replace
 
 from PyQt6.QtWidgets import (QApplication, QWidget, QGraphicsView, QGraphicsScene, 
-                             QGraphicsPixmapItem, QGraphicsLineItem, QVBoxLayout, 
+                             QGraphicsPixmapItem, QVBoxLayout, 
                              QToolBar, QTabWidget, QTreeView, QAbstractItemView, 
                              QLabel, QLineEdit, QSplitter, QSizePolicy, QComboBox,
                              QHBoxLayout, QLayout, QToolButton, QSpacerItem,
-                             QGraphicsItem, QGraphicsObject, QGraphicsRectItem)
+                             QGraphicsItem, QGraphicsObject, QGraphicsRectItem,
+                             QListView, QPinchGesture)
 from PyQt6.QtGui import (QPainter, QColor, QShowEvent, QPixmap, QKeyEvent, 
                          QWheelEvent, QPen, QKeySequence, QStandardItem, 
-                         QStandardItemModel, QActionGroup, QAction, QIcon)
+                         QStandardItemModel, QActionGroup, QAction,
+                         QImage, QPolygonF, QTransform)
+from PyQt6 import sip
 from PyQt6.QtCore import (Qt, pyqtSignal as Signal, pyqtSlot as Slot, 
-                          QObject, QEvent, QPointF, QRectF, QSize, 
-                          QItemSelection)
+                          QObject, QEvent, QPoint, QPointF, QRectF, QSize, QTimer,
+                          QItemSelection, QStandardPaths, QModelIndex,
+                          QAbstractListModel, QAbstractItemModel, QItemSelectionModel)
 
 from qt_theme_manager import theme_icon_manager
 
 
 SUPPORTED_FORMART = (".pdf", ".epub")
 
+DocumentSource = str | bytes | memoryview  # file path or buffer a document is opened from
+
 logger = logging.getLogger(__name__)
 
+
+def toQImage(fitzpix: pymupdf.Pixmap) -> QImage:
+    """
+        Wrap the samples of a pymupdf.Pixmap in a QImage without copying.
+
+        The QImage keeps a reference to the pymupdf.Pixmap so the buffer
+        stays alive as long as the QImage does.
+    """
+    if fitzpix.n == 1 and not fitzpix.alpha:
+        fmt = QImage.Format.Format_Grayscale8
+    elif fitzpix.n == 3 and not fitzpix.alpha:
+        fmt = QImage.Format.Format_RGB888
+    elif fitzpix.n == 4 and fitzpix.alpha and fitzpix.colorspace.n == 3:
+        fmt = QImage.Format.Format_RGBA8888_Premultiplied  # MuPDF alpha is premultiplied
+    else:
+        # CMYK, Gray + alpha, ... : let MuPDF convert to RGB(A) first
+        fitzpix = pymupdf.Pixmap(pymupdf.csRGB, fitzpix)
+        return toQImage(fitzpix)
+
+    image = QImage(fitzpix.samples_mv, fitzpix.width, fitzpix.height, fitzpix.stride, fmt)
+    image._fitzpix = fitzpix
+    return image
+
+
+def drawInBands(page_dlist: pymupdf.DisplayList, matrix: pymupdf.Matrix, clip: pymupdf.Rect = None,
+                cancelled=None, band_pixels: int = 2048 * 1024, min_rows: int = 256) -> pymupdf.Pixmap | None:
+    """
+        Rasterize a DisplayList like get_pixmap(alpha=0), in horizontal bands when it is large.
+
+        MuPDF holds the GIL while drawing, so renders over band_pixels are split in bands of
+        band_pixels, at least min_rows high, and cancelled() is checked before each band:
+        None is returned if it is true. Smaller and rotated renders are drawn at once and are
+        identical to get_pixmap. Like tiles, bands may differ from it in the anti-aliasing of
+        the strokes crossing their edges.
+    """
+    area = page_dlist.rect if clip is None else clip & page_dlist.rect
+    bbox = (area * matrix).round()
+    if matrix.b != 0 or matrix.c != 0 or bbox.width * bbox.height <= band_pixels:
+        return page_dlist.get_pixmap(alpha=0, matrix=matrix, clip=clip)
+
+    fitzpix = pymupdf.Pixmap(pymupdf.csRGB, bbox, False)
+    fitzpix.clear_with(255)
+
+    rows = max(min_rows, band_pixels // bbox.width)
+    for y in range(bbox.y0, bbox.y1, rows):
+        if cancelled is not None and cancelled():
+            return None
+        y1 = min(y + rows, bbox.y1)
+        band_clip = pymupdf.Rect(area.x0, (y - matrix.f) / matrix.d, area.x1, (y1 - matrix.f) / matrix.d) & area
+        band = page_dlist.get_pixmap(alpha=0, matrix=matrix, clip=band_clip)
+        fitzpix.copy(band, band.irect)
+        time.sleep(0)  # hand the GIL over
+    return fitzpix
+
+
+def stopOnDestroyed(obj: QObject, stop, thread: threading.Thread, timeout: float = 5.0):
+    """Call stop() and join the worker thread when the Qt object obj is destroyed"""
+    def onDestroyed():
+        stop()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+    obj.destroyed.connect(onDestroyed)
+
+
 class ZoomSelector(QWidget):
 
     class ZoomMode(Enum):
@@ -104,6 +194,113 @@ class ZoomSelector(QWidget):
             self.zoomFactorChanged.emit(factor)
 
 
+class PageLabels:
+    """
+        Page labels computed from the page label rules of the document, without loading pages.
+        The rules are read on first use and the labels are cached in both directions.
+    """
+    ROMAN = (("M", 1000), ("CM", 900), ("D", 500), ("CD", 400), ("C", 100), ("XC", 90),
+             ("L", 50), ("XL", 40), ("X", 10), ("IX", 9), ("V", 5), ("IV", 4), ("I", 1))
+
+    def __init__(self, doc: pymupdf.Document):
+        self._document = doc
+        self._rules: list[dict] = None
+        self._starts: list[int] = []  # startpage of the sorted rules
+        self._labels: dict[int, str] = {}
+        self._pnos: dict[str, int | None] = {}
+
+    def rules(self) -> list[dict]:
+        if self._rules is None:
+            rules = []
+            if self._document.is_pdf:
+                try:
+                    rules = self._document.get_page_labels()
+                except Exception as e:
+                    logger.error(f"Cannot read the page labels: {e}")
+            self._rules = sorted(rules, key=lambda rule: rule["startpage"])
+            self._starts = [rule["startpage"] for rule in self._rules]
+        return self._rules
+
+    def _rule(self, i: int) -> tuple[str, str, int, int]:
+        """style, prefix, startpage and number of startpage given to construct_label"""
+        rule = self._rules[i]
+        style = rule.get("style", "")
+        delta = -1 if style in ("a", "A") else 0  # same as page.get_label()
+        return style, rule.get("prefix", ""), rule["startpage"], rule.get("firstpagenum", 1) + delta
+
+    def label(self, pno: int) -> str:
+        label = self._labels.get(pno)
+        if label is None:
+            i = bisect.bisect_right(self._starts, pno) - 1 if self.rules() else -1
+            if i < 0:
+                label = ""
+            else:
+                style, prefix, startpage, first_number = self._rule(i)
+                label = pymupdf.utils.construct_label(style, prefix, pno - startpage + first_number)
+            self._labels[pno] = label
+        return label
+
+    def pno(self, label: str) -> int | None:
+        """Page number of a label, the last page when several pages have it"""
+        if label in self._pnos:
+            return self._pnos[label]
+
+        pno = None
+        rules = self.rules()
+        for i in reversed(range(len(rules))):
+            style, prefix, startpage, first_number = self._rule(i)
+            stop = self._starts[i + 1] if i + 1 < len(rules) else self._document.page_count
+            if not label.startswith(prefix):
+                continue
+
+            number = self.parseNumber(style, label[len(prefix):])
+            if style == "" and number == 0:
+                candidate = stop - 1
+            elif number is not None:
+                candidate = startpage + number - first_number
+            else:
+                continue
+
+            if startpage <= candidate < stop and self.label(candidate) == label:
+                pno = candidate
+                break
+
+        self._pnos[label] = pno
+        return pno
+
+    @classmethod
+    def parseNumber(cls, style: str, text: str) -> int | None:
+        """Inverse of pymupdf.utils.construct_label for the number part of a label"""
+        if style == "":
+            return 0 if text == "" else None
+
+        if text == "" or not text.isascii():
+            return None
+
+        if style == "D":
+            return int(text) if text.isdigit() else None
+
+        if (style in ("r", "a") and not text.islower()) or (style in ("R", "A") and not text.isupper()):
+            return None
+
+        if style in ("r", "R"):
+            text, number = text.upper(), 0
+            for numeral, value in cls.ROMAN:
+                while text.startswith(numeral):
+                    number, text = number + value, text[len(numeral):]
+            return number if text == "" else None
+
+        if style in ("a", "A") and text.isalpha():
+            # Letter sequences of n letters follow all the shorter ones, as in integerToLetter
+            number = sum(26 ** n for n in range(1, len(text)))
+            value = 0
+            for c in text.upper():
+                value = value * 26 + ord(c) - ord("A")
+            return number + value
+
+        return None
+
+
 class PageNavigator(QWidget):
     currentPnoChanged = Signal(int)
     currentLocationChanged = Signal(QPointF)
@@ -113,7 +310,7 @@ class PageNavigator(QWidget):
         self._current_pno: int = None  # pno : page number
         self._current_page_label: str = ""
         self._current_location: QPointF = QPointF()
-        self._page_index:  dict[str, int] = {}
+        self._page_labels: PageLabels = None
 
         hbox = QHBoxLayout()
         hbox.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
@@ -136,15 +333,13 @@ class PageNavigator(QWidget):
 
     def setDocument(self, document: pymupdf.Document):
         self._document: pymupdf.Document = document
-        self.indexPages()
+        self._page_labels = PageLabels(document)
+
+    def pageLabels(self) -> PageLabels:
+        return self._page_labels
 
-    def indexPages(self):
-        page: pymupdf.Page
-        for page in self._document:
-            self._page_index.update({page.get_label() : page.number})
-    
     def pageNumberFromLabel(self, label) -> int | None:
-        return self._page_index.get(label)
+        return self._page_labels.pno(label)
 
     def updatePageLineEdit(self):
         page_label = self.currentPageLabel()
@@ -170,8 +365,7 @@ class PageNavigator(QWidget):
                 self.currentPnoChanged.emit(self._current_pno)
 
     def currentPageLabel(self) -> str:
-        page: pymupdf.Page = self._document[self.currentPno()]
-        return page.get_label()
+        return self._page_labels.label(self.currentPno())
 
     def currentPno(self) -> int:
         return self._current_pno
@@ -211,12 +405,14 @@ class Kind(Enum):
     LINK_NAMED = 4
     LINK_GOTOR = 5
 
-class OutlineItem(QStandardItem):
-    def __init__(self, data: list):
-        super().__init__()
+class OutlineItem:
+    def __init__(self, data: list, toc_index: int = -1, resolve=None):
         self.lvl: int = data[0]
         self.title: str = data[1]
         self.page: int = int(data[2]) - 1
+        self.toc_index = toc_index  # position in OutlineModel.getToc()
+        self.details: dict = None
+        self._resolve = resolve  # callable(toc_index) -> details, when data has none
 
         try:
             self.details: dict = data[3]
@@ -224,45 +420,232 @@ class OutlineItem(QStandardItem):
             # data[2] is 1-based source page number
             pass
 
-        self.setData(self.title, role=Qt.ItemDataRole.DisplayRole)
-
-    def getDetails(self):
+    def getDetails(self) -> dict | None:
+        """Link details of the entry, resolved on first use"""
+        if self.details is None and self._resolve is not None:
+            self.details = self._resolve(self.toc_index)
+            self._resolve = None
         return self.details
 
 
-class OutlineModel(QStandardItemModel):
+class OutlineModel(QAbstractItemModel):
+    """
+        Outline of the document from the flat get_toc list.
+
+        The tree structure is computed in one pass over the entries, the child lists and
+        the OutlineItem of the entries, with their link details, are created when a view
+        first asks for them.
+        indexForPage finds the entry of the section containing a page by bisection.
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
 
-    def setupModelData(self, outline: list[list]):    
-        parents: list[OutlineItem] = []
+        self._document: pymupdf.Document = None
+        self._toc: list[list] = []
+        self._nodes: list[pymupdf.Outline] = []  # outline node of each entry, for the details
+        self._xrefs: dict[int, int] = {}  # toc index -> xref of the PDF outline item, read on demand
+        self._parents: list[int] = []  # toc index of the parent entry, -1 for top level entries
+        self._ends: list[int] = []  # toc index following the last descendant
+        self._children: dict[int, list[int]] = {}  # toc index (-1: root) -> children, built on demand
+        self._rows: dict[int, int] = {}  # toc index -> row in the parent
+        self._items: dict[int, OutlineItem] = {}
+        self._section_pnos: list[int] = []  # sorted pno of the entries with a target page
+        self._section_entries: list[int] = []  # matching toc index
+
+    def setupModelData(self, outline: list[list]):
+        """Build the model from get_toc entries, the details are optional"""
+        self.beginResetModel()
+
+        self._toc = outline
+        self._parents = []
+        self._ends = [len(outline)] * len(outline)
+        self._children = {}
+        self._rows = {}
+        self._items = {}
+
+        opened: list[int] = []
+        for i, entry in enumerate(outline):
+            while opened and outline[opened[-1]][0] >= entry[0]:
+                self._ends[opened.pop()] = i
+            self._parents.append(opened[-1] if opened else -1)
+            opened.append(i)
+
+        sections = sorted((entry[2] - 1, i) for i, entry in enumerate(outline) if entry[2] > 0)
+        self._section_pnos = [pno for pno, _ in sections]
+        self._section_entries = [i for _, i in sections]
+
+        self.endResetModel()
 
-        prev_child = OutlineItem([0, "", 0, {}])
-        parents.append(prev_child)
+    def setDocument(self, doc: pymupdf.Document):
+        self._document = doc
+        self.setupModelData(self.getToc())
 
-        for item in outline:
-            child = OutlineItem(item)
+    def getToc(self) -> list[list]:
+        """
+            Entries of get_toc(simple=True), without the costly link details of simple=False.
+            The outline nodes are kept to resolve the details of the entries shown.
+        """
+        toc, self._nodes, self._xrefs = [], [], {}
+        stack = [(self._document.outline, 1)]
+        while stack:
+            node, lvl = stack.pop()
+            if not node or not node.this.m_internal:
+                continue
 
-            if child.lvl == 1:
-                parent = self.invisibleRootItem()
-            elif child.lvl > prev_child.lvl:
-                parents.append(prev_child)
-                parent = parents[-1]
-            elif child.lvl < prev_child.lvl:
-                parents.pop()
-                parent = parents[-1]
+            stack.append((node.next, lvl))
+            if node.down:
+                stack.append((node.down, lvl + 1))
 
-            parent.appendRow(child)
+            if node.is_external or not node.uri:
+                page = -1
+            elif node.page == -1:
+                page = self._document.resolve_link(node.uri)[0] + 1
+            else:
+                page = node.page + 1
 
-            prev_child = child
+            toc.append([lvl, node.title or " ", page])
+            self._nodes.append(node)
+        return toc
 
-    def setDocument(self, doc: pymupdf.Document):
-        self._document = doc
-        self.setupModelData(self.getToc())
+    def _outlineXref(self, toc_index: int) -> int:
+        """Xref of the PDF outline item of an entry, 0 if unknown, from First/Next of its parent"""
+        xref = self._xrefs.get(toc_index)
+        if xref is not None:
+            return xref
+        if not self._document.is_pdf:
+            return 0
+
+        parent = self._parents[toc_index]
+        if parent < 0:
+            parent_xref = self._refKey(self._document.pdf_catalog(), "Outlines")
+        else:
+            parent_xref = self._outlineXref(parent)
+        xref = self._refKey(parent_xref, "First") if parent_xref else 0
+        for sibling in self._childEntries(parent):
+            self._xrefs[sibling] = xref
+            if sibling == toc_index:
+                break
+            xref = self._refKey(xref, "Next") if xref else 0
+        return self._xrefs[toc_index]
+
+    def _details(self, toc_index: int) -> dict:
+        """Link details of an entry, as in get_toc(simple=False)"""
+        details = pymupdf.utils.getLinkDict(self._nodes[toc_index], self._document)
+        return self._extendDetails(toc_index, details)
+
+    def _refKey(self, xref: int, key: str) -> int:
+        """Xref of the object referenced by key in the dictionary xref, 0 if none"""
+        kind, value = self._document.xref_get_key(xref, key)
+        return int(value.split()[0]) if kind == "xref" else 0
+
+    def _extendDetails(self, toc_index: int, details: dict) -> dict:
+        """Add the keys of get_toc(simple=False) read from the PDF outline item: xref, bold, italic, collapse, color, zoom"""
+        xref = self._outlineXref(toc_index)
+        if xref == 0:
+            return details
+
+        doc = self._document
+        details["xref"] = xref
+        kind, flags = doc.xref_get_key(xref, "F")
+        flags = int(flags) if kind == "int" else 0
+        if flags & 1:
+            details["italic"] = True
+        if flags & 2:
+            details["bold"] = True
+        kind, count = doc.xref_get_key(xref, "Count")
+        if kind == "int" and int(count) != 0:
+            details["collapse"] = int(count) < 0
+        kind, color = doc.xref_get_key(xref, "C")
+        if kind == "array":
+            color = color.strip("[]").split()
+            if len(color) == 3:
+                details["color"] = tuple(float(c) for c in color)
+        kind, dest = doc.xref_get_key(xref, "Dest")
+        if kind != "array":
+            kind, dest = doc.xref_get_key(xref, "A/D")
+        dest = dest.strip("[]").replace("/", " /").split() if kind == "array" else []
+        zoom = 0.0
+        if len(dest) == 7 and dest[2] == "R":  # [n 0 R /XYZ left top zoom]
+            try:
+                zoom = float(dest[6])
+            except ValueError:
+                pass
+        details["zoom"] = zoom
+        return details
+
+    def _childEntries(self, toc_index: int) -> list[int]:
+        children = self._children.get(toc_index)
+        if children is None:
+            children = []
+            i = toc_index + 1
+            end = self._ends[toc_index] if toc_index >= 0 else len(self._toc)
+            while i < end:
+                self._rows[i] = len(children)
+                children.append(i)
+                i = self._ends[i]
+            self._children[toc_index] = children
+        return children
+
+    def _item(self, toc_index: int) -> OutlineItem:
+        item = self._items.get(toc_index)
+        if item is None:
+            entry = self._toc[toc_index]
+            resolve = self._details if len(entry) < 4 and toc_index < len(self._nodes) else None
+            item = OutlineItem(entry, toc_index, resolve)
+            self._items[toc_index] = item
+        return item
+
+    def _index(self, toc_index: int) -> QModelIndex:
+        if toc_index < 0:
+            return QModelIndex()
+        self._childEntries(self._parents[toc_index])
+        return self.createIndex(self._rows[toc_index], 0, self._item(toc_index))
+
+    def _tocIndex(self, index: QModelIndex) -> int:
+        return index.internalPointer().toc_index if index.isValid() else -1
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        children = self._childEntries(self._tocIndex(parent))
+        if column != 0 or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, self._item(children[row]))
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        return self._index(self._parents[self._tocIndex(index)])
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        toc_index = self._tocIndex(parent)
+        if toc_index < 0:
+            return len(self._toc) > 0
+        return self._ends[toc_index] > toc_index + 1
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._childEntries(self._tocIndex(parent)))
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return index.internalPointer().title
+        return None
+
+    def item(self, index: QModelIndex) -> OutlineItem | None:
+        return index.internalPointer() if index.isValid() else None
+
+    def indexForPage(self, pno: int) -> QModelIndex:
+        """Index of the last entry targeting pno or a previous page, the section containing pno"""
+        i = bisect.bisect_right(self._section_pnos, pno) - 1
+        if i < 0:
+            return QModelIndex()
+        return self._index(self._section_entries[i])
 
-    def getToc(self):
-        toc = self._document.get_toc(simple=False)
-        return toc
 
 @dataclass
 class GoToLink:
@@ -279,10 +662,14 @@ class GoToLink:
 
     def __post_init__(self, page: pymupdf.Page):
         self.page_from = page.number
+
+    def resolveLabel(self, page: pymupdf.Page, textpage: pymupdf.TextPage = None) -> str:
+        """Set the label from the text under the hotspot, textpage is a TextPage of page"""
         height_correction = self.hotspot.height * 0.1
         rect = self.hotspot + [0, height_correction, 0, -height_correction]
-        label: str = page.get_textbox(rect)
+        label: str = page.get_textbox(rect, textpage=textpage)
         self.label = label.strip().replace("\n", " ")
+        return self.label
 
 @dataclass
 class UriLink:
@@ -297,10 +684,14 @@ class UriLink:
 
     def __post_init__(self, page: pymupdf.Page):
         self.page_from = page.number
+
+    def resolveLabel(self, page: pymupdf.Page, textpage: pymupdf.TextPage = None) -> str:
+        """Set the label from the text under the hotspot, textpage is a TextPage of page"""
         height_correction = self.hotspot.height * 0.1
         rect = self.hotspot + [0, height_correction, 0, -height_correction]
-        label: str = page.get_textbox(rect)
+        label: str = page.get_textbox(rect, textpage=textpage)
         self.label = label.strip().replace("\n", " ")
+        return self.label
 
 @dataclass
 class NamedLink:
@@ -318,10 +709,14 @@ class NamedLink:
 
     def __post_init__(self, page: pymupdf.Page):
         self.page_from = page.number
+
+    def resolveLabel(self, page: pymupdf.Page, textpage: pymupdf.TextPage = None) -> str:
+        """Set the label from the text under the hotspot, textpage is a TextPage of page"""
         height_correction = - self.hotspot.height * 0.1
         rect = self.hotspot + [0, height_correction, 0, -height_correction]
-        label: str = page.get_textbox(rect)
+        label: str = page.get_textbox(rect, textpage=textpage)
         self.label = label.strip().replace("\n", " ")
+        return self.label
 
 class LinkFactory:
     def __init__(self):
@@ -338,35 +733,94 @@ class LinkFactory:
             if link['kind'] == key.value:
                 return val(*link.values(), page)
             
-class LinkItem(QStandardItem):
-    def __init__(self, link: GoToLink | UriLink | NamedLink):
-        super().__init__()
-        self._link = link
+class LinkModel(QAbstractListModel):
+    """
+        GOTO and NAMED links of the document, one row per link.
 
-        self.setData(self._link.label, role=Qt.ItemDataRole.DisplayRole)
-    
-    def link(self):
-        return self._link
+        Pages are scanned on demand by fetchMore as the view scrolls, and the label of a link,
+        the text under its hotspot, is only extracted when its row is displayed. Views should
+        set uniformRowHeights, otherwise they query the label of every row to size them.
+    """
+    LinkRole = Qt.ItemDataRole.UserRole
+
+    fetch_pages = 50  # max pages scanned by fetchMore once a link is found
+    fetch_links = 100  # fetchMore stops after this many links
 
-class LinkModel(QStandardItemModel):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-    def setDocument(self, doc: pymupdf.Document):
-        self._document = doc
-        self.setupModelData()
+        self._document: pymupdf.Document = None
+        self._links: list[GoToLink | NamedLink] = []
+        self._labelled: set[int] = set()  # rows with a resolved label
+        self._next_pno = 0  # first page not scanned yet
+        self._link_factory = LinkFactory()
+        self._textpages = TextPageCache()
 
-    def setupModelData(self):    
-        parent = self.invisibleRootItem()
+    def setTextPageCache(self, textpages: "TextPageCache"):
+        """Share the TextPages of the pages with the view"""
+        self._textpages = textpages
 
-        link_factory = LinkFactory()
+    def setDocument(self, doc: pymupdf.Document):
+        self.beginResetModel()
+        self._document = doc
+        self._textpages.setDocument(doc)
+        self._links = []
+        self._labelled = set()
+        self._next_pno = 0
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._links)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if parent.isValid() or self._document is None:
+            return False
+        return self._next_pno < self._document.page_count
+
+    def fetchMore(self, parent: QModelIndex):
+        if not self.canFetchMore(parent):
+            return
 
-        for page in self._document:
+        # Scan past fetch_pages until a link is found: views only fetch again after rows were inserted
+        links = []
+        page_count = self._document.page_count
+        stop = min(self._next_pno + self.fetch_pages, page_count)
+        while ((self._next_pno < stop or (len(links) == 0 and self._next_pno < page_count))
+               and len(links) < self.fetch_links):
+            page: pymupdf.Page = self._document[self._next_pno]
             for link in page.links([pymupdf.LINK_GOTO, pymupdf.LINK_NAMED]):
-                link_object = link_factory.createLink(link, page)
-
-                link_item = LinkItem(link_object)
-                parent.appendRow(link_item)
+                links.append(self._link_factory.createLink(link, page))
+            self._next_pno += 1
+
+        if len(links) > 0:
+            row = len(self._links)
+            self.beginInsertRows(QModelIndex(), row, row + len(links) - 1)
+            self._links.extend(links)
+            self.endInsertRows()
+
+    def setupModelData(self):
+        """Scan all the pages at once"""
+        while self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        link = self._links[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.row() not in self._labelled:
+                link.resolveLabel(*self._textpages.get(link.page_from))
+                self._labelled.add(index.row())
+            return link.label
+        elif role == self.LinkRole:
+            return link
+        return None
+
+    def link(self, index: QModelIndex) -> GoToLink | NamedLink:
+        return self._links[index.row()]
 
 class SearchItem(QStandardItem):
     def __init__(self, result: dict):
@@ -382,37 +836,537 @@ class SearchItem(QStandardItem):
         return self.pno, self.quads, self.page_label
 
 
+def cacheDirectory(name: str) -> str:
+    """Return the directory `name` in the application cache location, created if needed"""
+    location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    path = os.path.join(location, "pymupdf_qt_viewer", name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class CacheDirectoryLimit:
+    """
+        Keep the files of the cache directory `name` under max_bytes.
+
+        The size is scanned on the first write and then updated by written(). Past max_bytes the
+        least recently used files, by modification time, are deleted down to 90% of max_bytes:
+        readers touch the files they use.
+    """
+    def __init__(self, name: str, max_bytes: int):
+        self._name = name
+        self._max_bytes = max_bytes
+        self._total_bytes: int = None  # size of the cache, scanned on first write
+        self._lock = threading.Lock()
+
+    def maxBytes(self) -> int:
+        return self._max_bytes
+
+    def setMaxBytes(self, max_bytes: int):
+        self._max_bytes = max_bytes
+
+    def written(self, added_bytes: int, replaced_bytes: int = 0):
+        """Account for a file of added_bytes written over one of replaced_bytes"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._files())
+            else:
+                self._total_bytes += added_bytes - replaced_bytes
+            if self._total_bytes > self._max_bytes:
+                self.cleanup()
+
+    def _files(self) -> list[tuple[float, int, str]]:
+        files = []
+        for root, _, names in os.walk(cacheDirectory(self._name)):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def cleanup(self):
+        """Delete the least recently used files until the cache is under 90% of max_bytes"""
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self._max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError as e:
+                logger.error(f"Cannot remove {path}: {e}")
+        self._total_bytes = total
+
+
+def documentFingerprint(source: DocumentSource, sample_size: int = 1 << 20) -> str:
+    """
+        Fingerprint of the content of a document file or buffer, from its size and its first and
+        last sample_size bytes, where a PDF keeps its header, trailer and last incremental update.
+        The modification time of a file is included, so that rewriting it invalidates the caches.
+    """
+    if not isinstance(source, str):
+        view = memoryview(source).cast("B")
+        size = len(view)
+        digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+        digest.update(view[:sample_size])
+        if size > sample_size:
+            digest.update(view[max(sample_size, size - sample_size):])
+        return digest.hexdigest()
+
+    stat = os.stat(source)
+    size = stat.st_size
+    digest = hashlib.blake2b(f"{size}:{stat.st_mtime_ns}".encode(), digest_size=16)
+    with open(source, "rb") as f:
+        digest.update(f.read(sample_size))
+        if size > sample_size:
+            f.seek(max(sample_size, size - sample_size))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def streamBuffer(stream) -> bytes | memoryview:
+    """
+        Buffer of stream for pymupdf.Document(stream=...), without copying the content when possible.
+
+        bytes are used as is, bytearray, mmap and io.BytesIO are wrapped in a memoryview, which
+        prevents resizing or closing them while the document is open. A memoryview is cast to
+        unsigned bytes, or copied if it is not contiguous.
+        A file object of a local file is memory-mapped, other file-like objects are read.
+    """
+    if isinstance(stream, bytes):
+        return stream
+    if isinstance(stream, memoryview):
+        if not stream.c_contiguous:
+            return stream.tobytes()
+        return stream if stream.format == "B" and stream.ndim == 1 else stream.cast("B")
+    if isinstance(stream, (bytearray, mmap.mmap)):
+        return memoryview(stream)
+    if isinstance(stream, io.BytesIO):
+        return stream.getbuffer()
+    if hasattr(stream, "fileno"):
+        try:
+            return memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError, io.UnsupportedOperation):
+            pass  # not a regular file, or empty
+    if hasattr(stream, "read"):
+        return stream.read()
+    raise TypeError(f"Cannot open a document from {type(stream).__name__}")
+
+
+def openDocument(source: DocumentSource) -> pymupdf.Document:
+    """Open a new handle on the document of a file path or a buffer, the type of a buffer is detected"""
+    if isinstance(source, str):
+        return pymupdf.Document(source)
+    return pymupdf.Document(stream=source)
+
+
+class SearchIndex:
+    """
+        Full-text index of the pages of a document file or buffer in a SQLite FTS5 table, stored
+        in the cache directory under the document fingerprint and reused across sessions.
+
+        The trigram tokenizer matches any substring of 3 characters or more. The index only
+        narrows a search to candidate pages, the quads are still computed by page.search_for.
+    """
+    commit_pages = 100
+
+    def __init__(self, source: DocumentSource, fingerprint: str = None):
+        self._source = source
+        self._fingerprint = fingerprint or documentFingerprint(source)
+        self._db_path = os.path.join(cacheDirectory("search"), f"{self._fingerprint}.sqlite")
+        self._complete = False
+        self._stop = threading.Event()
+
+    @staticmethod
+    def normalizeText(text: str) -> str:
+        return " ".join(text.split())
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path)
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(text, tokenize='trigram case_sensitive 0')")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+        return conn
+
+    def isComplete(self) -> bool:
+        return self._complete
+
+    def build(self):
+        """Index the pages not indexed yet, blocking, resumes an interrupted build"""
+        try:
+            with closing(self.connect()) as conn:
+                if conn.execute("SELECT value FROM meta WHERE key = 'complete'").fetchone() is not None:
+                    self._complete = True
+                    return
+
+                start = conn.execute("SELECT coalesce(max(rowid) + 1, 0) FROM pages").fetchone()[0]
+                with openDocument(self._source) as doc:
+                    for pno in range(start, doc.page_count):
+                        if self._stop.is_set():
+                            conn.commit()
+                            return
+
+                        text = doc[pno].get_text("text", flags=pymupdf.TEXTFLAGS_SEARCH)
+                        conn.execute("INSERT OR REPLACE INTO pages (rowid, text) VALUES (?, ?)", (pno, self.normalizeText(text)))
+                        if (pno + 1) % self.commit_pages == 0:
+                            conn.commit()
+
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('complete', 1)")
+                conn.commit()
+                self._complete = True
+        except (sqlite3.Error, RuntimeError) as e:
+            logger.error(f"Cannot build the search index {self._fingerprint}: {e}")
+
+    def stop(self):
+        self._stop.set()
+
+    def candidatePages(self, text: str) -> list[int] | None:
+        """Sorted pno of the pages that may contain text, None if the index cannot tell"""
+        text = self.normalizeText(text)
+        if not self._complete or len(text) < 3:
+            return None
+
+        phrase = '"' + text.replace('"', '""') + '"'
+        try:
+            with closing(sqlite3.connect(self._db_path)) as conn:
+                rows = conn.execute("SELECT rowid FROM pages WHERE pages MATCH ? ORDER BY rowid", (phrase,))
+                return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Cannot query the search index {self._fingerprint}: {e}")
+            return None
+
+
+_shard_document: pymupdf.Document = None
+_shard_document_key: tuple = None
+
+
+def searchShard(filepath: str, text: str, start: int, stop: int) -> list[tuple]:
+    """
+        Search the pages [start, stop) of a document file. Runs in the search process pool,
+        where each worker keeps its own handle on the last document.
+
+        Quads are returned as tuples of points, pymupdf.Quad does not pickle.
+    """
+    global _shard_document, _shard_document_key
+
+    key = (filepath, os.stat(filepath).st_mtime_ns)
+    if key != _shard_document_key:
+        if _shard_document is not None:
+            _shard_document.close()
+        _shard_document = pymupdf.Document(filepath)
+        _shard_document_key = key
+
+    results = []
+    for pno in range(start, stop):
+        page: pymupdf.Page = _shard_document[pno]
+        quads: list = page.search_for(text, quads=True)
+        if len(quads) > 0:
+            results.append((pno, [tuple(tuple(point) for point in quad) for quad in quads]))
+    return results
+
+
 class SearchModel(QStandardItemModel):
+    """
+        Search results, one row per page with hits, in page order.
+
+        searchFor runs in a worker thread, from the start page to the end of the document
+        and then from the first page, and streams the results of each page into the model.
+        A new search or stop() cancels the running one.
+
+        Large documents opened from a file are split in page ranges searched in parallel
+        by a process pool, smaller, password protected, modified or opened from a buffer ones
+        in the worker thread.
+        Once their SearchIndex is built, only the candidate pages it returns are searched.
+    """
     sigTextFound = Signal(str)
+    sigPageFound = Signal(int)  # pno
+    sigSearchProgress = Signal(int, int)  # pages searched, page count
+
+    _sigWorkerPageFound = Signal(int, int, list)  # search id, pno, quads
+    _sigWorkerProgress = Signal(int, int, int)  # search id, pages searched, page count
+
+    progress_step = 50  # pages between two progress reports
+    pool_min_pages = 64  # smaller documents are searched in the worker thread
+    shard_min_pages = 16
+    max_workers = os.cpu_count() or 1
+    index_min_pages = 64  # smaller documents are not indexed
+
+    _pool: concurrent.futures.ProcessPoolExecutor = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        self._document: pymupdf.Document = None
+        self._page_labels: PageLabels = None
+        self._source: DocumentSource = ""
+        self._fingerprint: str = None
+        self._futures: list[concurrent.futures.Future] = []
+        self._search_thread: threading.Thread = None
+        self._index: SearchIndex = None
+        self._index_thread: threading.Thread = None
+        self._index_enabled = True
         self._search_results: dict[int, list] = {}
+        self._result_pnos: list[int] = []  # sorted pno of the rows
+        self._found_count = 0
+        self._search_id = 0
+        self._searching = False
 
-    def setDocument(self, doc: pymupdf.Document):
+        self._sigWorkerPageFound.connect(self._onPageFound)
+        self._sigWorkerProgress.connect(self._onProgress)
+
+        self._textpages = TextPageCache()
+        self.stats = RenderStats()
+        self._search_started = 0.0
+        self._searched_pages = 0
+
+        stopOnDestroyed(self, self._shutdown, None)
+
+    def setStats(self, stats: "RenderStats"):
+        """Record the search time and pages searched in stats"""
+        self.stats = stats
+
+    def setTextPageCache(self, textpages: "TextPageCache"):
+        """Share the TextPages of the pages with the view"""
+        self._textpages = textpages
+
+    def _recordStats(self):
+        self.stats.record("search", time.perf_counter() - self._search_started)
+        self.stats.count("search_pages", self._searched_pages)
+
+    def setDocument(self, doc: pymupdf.Document, source: DocumentSource = "", fingerprint: str = None):
+        """
+            source, the file path or buffer doc was opened from, enables the index and the pool.
+            fingerprint is its documentFingerprint, computed by the index when None.
+        """
+        self.stop()
         self._document = doc
+        self._page_labels = PageLabels(doc)
+        self._source = source
+        self._fingerprint = fingerprint
+        self._textpages.setDocument(doc)
+        self.buildIndex()
+
+    def indexEnabled(self) -> bool:
+        return self._index_enabled
+
+    def setIndexEnabled(self, enabled: bool):
+        self._index_enabled = enabled
+        self.buildIndex()
+
+    def _shutdown(self):
+        """
+            Cancel the search and the index build once the model is destroyed. The Qt object
+            is already deleted: no signal is emitted and the model is left as is.
+        """
+        self._search_id += 1
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+        if self._search_thread is not None:
+            self._search_thread.join(5.0)
+        self.stopIndex(wait=True)
+
+    def stopIndex(self, wait: bool = False):
+        """Stop building the SearchIndex, wait for the build thread to return if wait"""
+        if self._index is not None:
+            self._index.stop()
+            self._index = None
+        if wait and self._index_thread is not None:
+            self._index_thread.join(5.0)
+        self._index_thread = None
+
+    def buildIndex(self):
+        """Start building the SearchIndex of the document in the background"""
+        self.stopIndex()
+
+        doc = self._document
+        if (not self._index_enabled
+                or not self._source
+                or doc is None
+                or doc.page_count < self.index_min_pages
+                or doc.needs_pass):
+            return
+
+        try:
+            self._index = SearchIndex(self._source, self._fingerprint)
+        except OSError as e:
+            logger.error(f"Cannot create the search index of {doc.name}: {e}")
+            return
+
+        self._index_thread = threading.Thread(target=self._index.build, name="SearchIndex", daemon=True)
+        self._index_thread.start()
+
+    def searchIndex(self) -> SearchIndex:
+        return self._index
 
-    def searchFor(self, text: str):
+    @classmethod
+    def searchPool(cls) -> concurrent.futures.ProcessPoolExecutor:
+        """Process pool shared by all the models, started on first use"""
+        if cls._pool is None:
+            cls._pool = concurrent.futures.ProcessPoolExecutor(max_workers=cls.max_workers,
+                                                               mp_context=multiprocessing.get_context("spawn"))
+            atexit.register(cls._pool.shutdown, wait=False, cancel_futures=True)
+        return cls._pool
+
+    def usesSearchPool(self) -> bool:
+        doc = self._document
+        return (self.max_workers > 1
+                and isinstance(self._source, str)
+                and self._source != ""
+                and doc.page_count >= self.pool_min_pages
+                and not doc.needs_pass
+                and not doc.is_dirty)
+
+    def searchFor(self, text: str, start_pno: int = 0):
+        self.stop()
         self.clear()
         self._search_results.clear()
+        self._result_pnos.clear()
         
         self._found_count = 0
 
-        if text != "":
-            root_item = self.invisibleRootItem()
-            page: pymupdf.Page
-            for page in self._document:
-                quads: list = page.search_for(text, quads=True)
-                
-                if len(quads) > 0:
-                    self._found_count = self._found_count + len(quads)
-                    page_result = {"pno" : page.number, "label": page.get_label(), "quads" : quads}
-                    self._search_results.update({page.number: quads})
-                    search_item = SearchItem(page_result)
-                    root_item.appendRow(search_item)
-        
-        self.sigTextFound.emit(f"Hits: {self._found_count}")
+        if text == "" or self._document is None or self._document.page_count == 0:
+            self.sigTextFound.emit(f"Hits: {self._found_count}")
+            return
+
+        self._searching = True
+        self._search_started = time.perf_counter()
+        self._searched_pages = 0
+        self._search_thread = threading.Thread(target=self._run,
+                                               args=(self._search_id, self._document, text, start_pno),
+                                               name="SearchModel",
+                                               daemon=True)
+        self._search_thread.start()
+
+    def stop(self):
+        """Cancel the running search"""
+        self._search_id += 1
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+        if self._searching:
+            self._searching = False
+            self._recordStats()
+            self.sigTextFound.emit(f"Hits: {self._found_count}")
+
+    def isSearching(self) -> bool:
+        return self._searching
+
+    def _run(self, search_id: int, doc: pymupdf.Document, text: str, start_pno: int):
+        start_pno = min(max(start_pno, 0), doc.page_count - 1)
+
+        index = self._index
+        pnos = index.candidatePages(text) if index is not None and not doc.is_dirty else None
+
+        try:
+            if pnos is not None:
+                first = bisect.bisect_left(pnos, start_pno)
+                self._search(search_id, doc, text, pnos[first:] + pnos[:first])
+            elif self.usesSearchPool():
+                self._searchShards(search_id, doc, text, start_pno)
+            else:
+                pnos = list(range(doc.page_count))
+                self._search(search_id, doc, text, pnos[start_pno:] + pnos[:start_pno])
+        except RuntimeError:
+            if not sip.isdeleted(self):
+                raise
+            # model deleted while searching
+
+    def _search(self, search_id: int, doc: pymupdf.Document, text: str, pnos: list[int]):
+        page_count = len(pnos)
+        if page_count == 0:
+            self._sigWorkerProgress.emit(search_id, 0, 0)
+            return
+
+        for i, pno in enumerate(pnos):
+            if search_id != self._search_id:
+                return
+
+            page, textpage = self._textpages.get(pno, keep=False)
+            quads: list = page.search_for(text, quads=True, textpage=textpage)
+
+            if len(quads) > 0:
+                self._sigWorkerPageFound.emit(search_id, page.number, quads)
+
+            if (i + 1) % self.progress_step == 0 or i + 1 == page_count:
+                self._sigWorkerProgress.emit(search_id, i + 1, page_count)
+
+    def _searchShards(self, search_id: int, doc: pymupdf.Document, text: str, start_pno: int):
+        page_count = doc.page_count
+        shard_size = max(self.shard_min_pages, math.ceil(page_count / (self.max_workers * 4)))
+
+        # Submit the shard of the start page first and wrap around
+        starts = list(range(0, page_count, shard_size))
+        first = bisect.bisect_right(starts, start_pno) - 1
+        starts = starts[first:] + starts[:first]
+
+        pool = self.searchPool()
+        try:
+            shards = {pool.submit(searchShard, self._source, text, start, min(start + shard_size, page_count)): start
+                      for start in starts}
+        except RuntimeError:
+            return  # pool shut down at exit
+        self._futures = list(shards)
+
+        searched = 0
+        try:
+            for future in concurrent.futures.as_completed(shards):
+                if search_id != self._search_id:
+                    return
+
+                start = shards[future]
+                stop = min(start + shard_size, page_count)
+                try:
+                    results = future.result()
+                except concurrent.futures.CancelledError:
+                    return
+                except Exception as e:
+                    logger.error(f"Search of pages {start}-{stop - 1} failed in the process pool: {e}")
+                    results = []
+                    for pno in range(start, stop):
+                        page, textpage = self._textpages.get(pno, keep=False)
+                        quads = page.search_for(text, quads=True, textpage=textpage)
+                        if len(quads) > 0:
+                            results.append((pno, quads))
+
+                for pno, quads in results:
+                    self._sigWorkerPageFound.emit(search_id, pno, [pymupdf.Quad(*quad) for quad in quads])
+
+                searched = searched + stop - start
+                self._sigWorkerProgress.emit(search_id, searched, page_count)
+        finally:
+            for future in shards:
+                future.cancel()
+
+    @Slot(int, int, list)
+    def _onPageFound(self, search_id: int, pno: int, quads: list):
+        if search_id != self._search_id:
+            return
+
+        self._found_count = self._found_count + len(quads)
+        self._search_results.update({pno: quads})
+
+        row = bisect.bisect(self._result_pnos, pno)
+        self._result_pnos.insert(row, pno)
+        page_result = {"pno" : pno, "label": self._page_labels.label(pno), "quads" : quads}
+        self.insertRow(row, SearchItem(page_result))
+
+        self.sigPageFound.emit(pno)
+
+    @Slot(int, int, int)
+    def _onProgress(self, search_id: int, searched: int, page_count: int):
+        if search_id != self._search_id:
+            return
+
+        self._searched_pages = searched
+        self.sigSearchProgress.emit(searched, page_count)
+
+        if searched == page_count:
+            self._searching = False
+            self._recordStats()
+            self.sigTextFound.emit(f"Hits: {self._found_count}")
 
     def foundCount(self):
         return self._found_count
@@ -420,6 +1374,177 @@ class SearchModel(QStandardItemModel):
     def getSearchResults(self):
         return self._search_results
     
+class ThumbnailModel(QAbstractListModel):
+    """
+        One row per page with its label and thumbnail.
+
+        A thumbnail is only requested when a view asks for the decoration of its row, that
+        is when the row is painted. A worker thread serves the latest requests first, loads
+        the thumbnail from the disk cache, keyed by document fingerprint and page, or renders
+        it at low resolution and saves it there. The least recently used thumbnails are deleted
+        once the disk cache grows over max_cache_bytes.
+    """
+    _sigWorkerThumbnail = Signal(int, int, object)  # generation, pno, QImage
+
+    thumbnail_size = 128  # px, largest side
+    max_pixmaps = 512  # thumbnails kept in memory
+    max_pending = 64  # requests beyond are dropped, oldest first
+    max_cache_bytes = 64 * 1024 * 1024  # thumbnails kept on disk, all documents
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._document: pymupdf.Document = None
+        self._page_labels: PageLabels = None
+        self._cache_dir: str = None
+        self._cache_limit = CacheDirectoryLimit("thumbnails", self.max_cache_bytes)
+        self._generation = 0
+        self._pixmaps: OrderedDict[int, QPixmap] = OrderedDict()
+        self._pending: OrderedDict[int, None] = OrderedDict()  # pno requested, newest last
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._document_lock = threading.RLock()  # held while the worker reads the document
+
+        self._placeholder = QPixmap(self.thumbnail_size * 3 // 4, self.thumbnail_size)
+        self._placeholder.fill(QColor(230, 230, 230))
+
+        self._sigWorkerThumbnail.connect(self._onThumbnail)
+
+        self._worker = threading.Thread(target=self._run, name="ThumbnailModel", daemon=True)
+        self._worker.start()
+        stopOnDestroyed(self, self.stop, self._worker)
+
+    def setDocumentLock(self, lock: threading.RLock):
+        """Share the lock the other threads using the document hold, PyMuPDF documents are not thread safe"""
+        self._document_lock = lock
+
+    def setDocument(self, doc: pymupdf.Document, source: DocumentSource = "", fingerprint: str = None):
+        """
+            source, the file path or buffer doc was opened from, enables the disk cache.
+            fingerprint is its documentFingerprint, computed when None.
+        """
+        self.beginResetModel()
+        with self._condition:
+            self._generation += 1
+            self._pending.clear()
+            self._document = doc
+            self._cache_dir = None
+            if source:
+                try:
+                    name = f"{fingerprint or documentFingerprint(source)}_{self.thumbnail_size}"
+                    self._cache_dir = os.path.join(cacheDirectory("thumbnails"), name)
+                    os.makedirs(self._cache_dir, exist_ok=True)
+                except OSError as e:
+                    logger.error(f"Cannot use the thumbnail cache of {doc.name}: {e}")
+                    self._cache_dir = None
+        self._page_labels = PageLabels(doc)
+        self._pixmaps.clear()
+        self.endResetModel()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid() or self._document is None:
+            return 0
+        return self._document.page_count
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        pno = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._page_labels.label(pno) or f"{pno + 1}"
+        elif role == Qt.ItemDataRole.DecorationRole:
+            pixmap = self._pixmaps.get(pno)
+            if pixmap is not None:
+                self._pixmaps.move_to_end(pno)
+                return pixmap
+            self.requestThumbnail(pno)
+            return self._placeholder
+        return None
+
+    def requestThumbnail(self, pno: int):
+        with self._condition:
+            self._pending[pno] = None
+            self._pending.move_to_end(pno)
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                pno, _ = self._pending.popitem(last=True)
+                generation, doc, cache_dir = self._generation, self._document, self._cache_dir
+
+            try:
+                image = self.loadThumbnail(cache_dir, pno)
+                if image is None:
+                    image = self.renderThumbnail(doc, pno, cache_dir)
+            except Exception as e:
+                logger.error(f"Cannot render the thumbnail of page {pno}: {e}")
+                image = None
+
+            try:
+                self._sigWorkerThumbnail.emit(generation, pno, image)
+            except RuntimeError:
+                return  # model deleted
+
+    def loadThumbnail(self, cache_dir: str, pno: int) -> QImage | None:
+        if cache_dir is None:
+            return None
+        path = os.path.join(cache_dir, f"{pno}.png")
+        image = QImage(path)
+        if image.isNull():
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # deleted by a cleanup meanwhile
+        return image
+
+    def renderThumbnail(self, doc: pymupdf.Document, pno: int, cache_dir: str) -> QImage | None:
+        with self._document_lock:
+            page: pymupdf.Page = doc[pno]
+            zoom = self.thumbnail_size / max(page.rect.width, page.rect.height)
+            page_dlist = page.get_displaylist()
+        fitzpix = drawInBands(page_dlist, pymupdf.Matrix(zoom, zoom), cancelled=lambda: self._stopped)
+        if fitzpix is None:
+            return None
+
+        if cache_dir is not None:
+            path = os.path.join(cache_dir, f"{pno}.png")
+            try:
+                replaced_bytes = os.path.getsize(path) if os.path.exists(path) else 0
+                fitzpix.save(path + ".tmp", output="png")
+                os.replace(path + ".tmp", path)
+                self._cache_limit.written(os.path.getsize(path), replaced_bytes)
+            except (OSError, RuntimeError) as e:
+                logger.error(f"Cannot save the thumbnail of page {pno}: {e}")
+
+        return toQImage(fitzpix)
+
+    @Slot(int, int, object)
+    def _onThumbnail(self, generation: int, pno: int, image: QImage | None):
+        if generation != self._generation:
+            return
+
+        self._pixmaps[pno] = self._placeholder if image is None else QPixmap.fromImage(image)
+        while len(self._pixmaps) > self.max_pixmaps:
+            self._pixmaps.popitem(last=False)
+
+        index = self.index(pno)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+
 class MetaDataWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -507,33 +1632,262 @@ class RectItem(QGraphicsRectItem, BaseAnnotation):
 
         self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsMovable | QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
 
-class LinkBox(QGraphicsObject):
+class PageLinks:
+    """
+        GOTO and NAMED link hotspots of a page in page coordinates, stored in NumPy arrays,
+        with a grid of cell_size points mapping each cell to the links overlapping it.
+    """
+    cell_size = 64.0
+
+    def __init__(self, page: pymupdf.Page):
+        self.pno = page.number
+        rects, targets = [], []
+        grid: dict[tuple[int, int], list[int]] = {}
+
+        for i, link in enumerate(page.links([pymupdf.LINK_GOTO, pymupdf.LINK_NAMED])):
+            rect: pymupdf.Rect = link["from"]
+            rects.append((rect.x0, rect.y0, rect.x1, rect.y1))
+            targets.append(link.get("page", -1))
+            for cell in itertools.product(range(int(rect.x0 // self.cell_size), int(rect.x1 // self.cell_size) + 1),
+                                          range(int(rect.y0 // self.cell_size), int(rect.y1 // self.cell_size) + 1)):
+                grid.setdefault(cell, []).append(i)
+
+        self.rects = np.array(rects, dtype=np.float32).reshape(-1, 4)  # x0, y0, x1, y1 of each link
+        self.targets = np.array(targets, dtype=np.int32)  # target pno of each link
+        self._grid = {cell: np.array(links, dtype=np.int32) for cell, links in grid.items()}
+
+    def __len__(self):
+        return len(self.targets)
+
+    def rect(self, i: int) -> QRectF:
+        x0, y0, x1, y1 = self.rects[i].tolist()
+        return QRectF(QPointF(x0, y0), QPointF(x1, y1))
+
+    def boundingRect(self) -> QRectF:
+        if len(self.rects) == 0:
+            return QRectF()
+        x0, y0 = self.rects[:, :2].min(axis=0).tolist()
+        x1, y1 = self.rects[:, 2:].max(axis=0).tolist()
+        return QRectF(QPointF(x0, y0), QPointF(x1, y1))
+
+    def linkAt(self, point: QPointF) -> int | None:
+        """Index of the last link containing point, in page coordinates"""
+        x, y = point.x(), point.y()
+        links = self._grid.get((int(x // self.cell_size), int(y // self.cell_size)))
+        if links is None:
+            return None
+        rects = self.rects[links]
+        hits = np.flatnonzero((rects[:, 0] <= x) & (x <= rects[:, 2]) & (rects[:, 1] <= y) & (y <= rects[:, 3]))
+        return int(links[hits[-1]]) if len(hits) > 0 else None
+
+
+class PageGlyphs:
+    """
+        Character boxes of a page in reading order, read from its rawdict into NumPy arrays,
+        with the lines indexed in horizontal bands of band_size points.
+
+        A caret is the index of the character it stands before, the text between two carets
+        is a selection, from the first caret to the second in reading order.
+    """
+    band_size = 16.0
+
+    def __init__(self, page: pymupdf.Page, textpage: pymupdf.TextPage = None):
+        self.pno = page.number
+        chars, boxes, line_boxes, line_dirs, line_starts = [], [], [], [], [0]
+
+        for block in page.get_text("rawdict", textpage=textpage)["blocks"]:
+            for line in block.get("lines", ()):
+                for span in line["spans"]:
+                    for char in span["chars"]:
+                        chars.append(char["c"])
+                        boxes.append(char["bbox"])
+                if len(chars) > line_starts[-1]:
+                    line_boxes.append(line["bbox"])
+                    line_dirs.append(line["dir"])
+                    line_starts.append(len(chars))
+
+        self.text = "".join(chars)
+        self.boxes = np.array(boxes, dtype=np.float32).reshape(-1, 4)  # x0, y0, x1, y1 of each character
+        self.line_boxes = np.array(line_boxes, dtype=np.float32).reshape(-1, 4)
+        self.line_dirs = np.array(line_dirs, dtype=np.float32).reshape(-1, 2)
+        self.line_starts = np.array(line_starts, dtype=np.int32)  # first character of each line, then the count
+        self.char_lines = np.repeat(np.arange(len(line_boxes), dtype=np.int32), np.diff(self.line_starts))
+
+        # Position of the character centers along the direction of their line, increasing in a line
+        centers = (self.boxes[:, :2] + self.boxes[:, 2:]) / 2
+        self.positions = (centers * self.line_dirs[self.char_lines]).sum(axis=1)
+
+        bands: dict[int, list[int]] = {}
+        for i, (y0, y1) in enumerate(self.line_boxes[:, [1, 3]].tolist()):
+            for band in range(int(y0 // self.band_size), int(y1 // self.band_size) + 1):
+                bands.setdefault(band, []).append(i)
+        self._bands = {band: np.array(lines, dtype=np.int32) for band, lines in bands.items()}
+        self._all_lines = np.arange(len(line_boxes), dtype=np.int32)
+
+    def __len__(self):
+        return len(self.text)
+
+    def lineAt(self, x: float, y: float) -> int | None:
+        """Line containing the point (page coordinates) or the nearest one"""
+        if len(self._all_lines) == 0:
+            return None
+
+        for lines in (self._bands.get(int(y // self.band_size)), self._all_lines):
+            if lines is None:
+                continue
+            boxes = self.line_boxes[lines]
+            dx = np.maximum(np.maximum(boxes[:, 0] - x, x - boxes[:, 2]), 0)
+            dy = np.maximum(np.maximum(boxes[:, 1] - y, y - boxes[:, 3]), 0)
+            distances = dx * dx + dy * dy
+            i = int(distances.argmin())
+            if dy[i] == 0:
+                break  # the band holds the lines at the height of the point
+        return int(lines[i])
+
+    def caretAt(self, x: float, y: float) -> int:
+        """Caret nearest to the point, in page coordinates"""
+        line = self.lineAt(x, y)
+        if line is None:
+            return 0
+        start, stop = int(self.line_starts[line]), int(self.line_starts[line + 1])
+        dx, dy = self.line_dirs[line].tolist()
+        return start + int(np.searchsorted(self.positions[start:stop], x * dx + y * dy))
+
+    def selectedText(self, a: int, b: int) -> str:
+        """Text between the carets a and b, a line per line"""
+        start, stop = min(a, b), max(a, b)
+        if start == stop:
+            return ""
+        parts = []
+        for line in range(self.char_lines[start], self.char_lines[stop - 1] + 1):
+            parts.append(self.text[max(start, self.line_starts[line]):min(stop, self.line_starts[line + 1])])
+        return "\n".join(parts)
+
+    def selectedRects(self, a: int, b: int) -> np.ndarray:
+        """Rectangles x0, y0, x1, y1 of the characters between the carets a and b, one per line"""
+        start, stop = min(a, b), max(a, b)
+        if start == stop:
+            return np.empty((0, 4), dtype=np.float32)
+
+        lines = np.arange(self.char_lines[start], self.char_lines[stop - 1] + 1)
+        first = self.boxes[np.maximum(self.line_starts[lines], start)]
+        last = self.boxes[np.minimum(self.line_starts[lines + 1], stop) - 1]
+        return np.concatenate((np.minimum(first[:, :2], last[:, :2]), np.maximum(first[:, 2:], last[:, 2:])), axis=1)
+
+    def selectedQuads(self, a: int, b: int) -> list[pymupdf.Quad]:
+        return [pymupdf.Rect(rect).quad for rect in self.selectedRects(a, b).tolist()]
+
+
+class LinkLayer(QGraphicsObject):
+    """Link hotspots of a page painted in one pass, hit-tested through PageLinks"""
     sigJumpTo = Signal(int)
 
-    def __init__(self, link: pymupdf.Link, pno: int, zfactor: float, parent=None):
-        super(LinkBox, self).__init__(parent)
-        self.pno = pno
-        self.zfactor = zfactor
-        self.to_page: int = link["page"]
-        rect: pymupdf.Rect = link["from"]
-        a0 = QPointF(rect.x0,rect.y0) * self.zfactor
-        b1 = QPointF(rect.x1,rect.y1) * self.zfactor
-        self.rect = QRectF(a0, b1)
+    def __init__(self, links: PageLinks, parent=None):
+        super(LinkLayer, self).__init__(parent)
+        self.pno = links.pno
+        self.zfactor = 1.0  # scaled to the zoom factor of the view
+        self.links = links
+        self._rect = links.boundingRect()
 
         self.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setAcceptHoverEvents(True)
 
     def boundingRect(self):
-        return self.rect
+        return self._rect
 
     def paint(self, painter, option, widget):
-        painter.setPen(QPen(Qt.GlobalColor.cyan))
-        painter.drawRect(self.rect)
+        pen = QPen(Qt.GlobalColor.cyan)
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        for i in range(len(self.links)):
+            painter.drawRect(self.links.rect(i))
+
+    def hoverMoveEvent(self, event):
+        if self.links.linkAt(event.pos()) is None:
+            self.unsetCursor()
+        else:
+            self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def hoverLeaveEvent(self, event):
+        self.unsetCursor()
 
     def mousePressEvent(self, event):
-        self.sigJumpTo.emit(self.to_page)
+        i = self.links.linkAt(event.pos())
+        if i is None:
+            event.ignore()
+            return
+        self.sigJumpTo.emit(int(self.links.targets[i]))
         event.accept()
 
+class PageLayer(QGraphicsItem):
+    """
+        Parent of the items drawn over a page, placed at the page offset and scaled to the zoom.
+        Children are in page coordinates scaled by their zfactor.
+    """
+
+    def __init__(self, pno: int, parent=None):
+        super(PageLayer, self).__init__(parent)
+        self.pno = pno
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+
+    def addItem(self, item: QGraphicsItem):
+        item.setParentItem(self)
+        item.setScale(1 / item.zfactor)
+
+    def boundingRect(self):
+        return QRectF()
+
+    def paint(self, painter, option, widget):
+        pass
+
+class HighlightItem(QGraphicsItem):
+    """Quads of a page (search hits) painted over the page pixmap, in page coordinates"""
+
+    def __init__(self, quads: list[pymupdf.Quad], pno: int, color: QColor = QColor(255, 226, 0), parent=None):
+        super(HighlightItem, self).__init__(parent)
+        self.pno = pno
+        self.zfactor = 1.0  # scaled to the zoom factor of the view
+        self.color = color
+        self.polygons: list[QPolygonF] = []
+        self._rect = QRectF()
+        self.setQuads(quads)
+
+    def setQuads(self, quads: list[pymupdf.Quad]):
+        quad: pymupdf.Quad
+        self.setPolygons([QPolygonF([QPointF(quad.ul.x, quad.ul.y), QPointF(quad.ur.x, quad.ur.y),
+                                     QPointF(quad.lr.x, quad.lr.y), QPointF(quad.ll.x, quad.ll.y)])
+                          for quad in quads])
+
+    def setPolygons(self, polygons: list[QPolygonF]):
+        self.prepareGeometryChange()
+        self.polygons = polygons
+        self._rect = QRectF()
+        for polygon in polygons:
+            self._rect = self._rect.united(polygon.boundingRect())
+        self.update()
+
+    def boundingRect(self):
+        return self._rect
+
+    def paint(self, painter: QPainter, option, widget):
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Multiply)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.color)
+        for polygon in self.polygons:
+            painter.drawPolygon(polygon)
+
+class SelectionItem(HighlightItem, BaseAnnotation):
+    """Text selected on a page, updated while dragging, kept as an annotation once released"""
+
+    def __init__(self, pno: int, parent=None):
+        super(SelectionItem, self).__init__([], pno, QColor(153, 201, 255), parent)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
+
+    def setRects(self, rects: np.ndarray):
+        """Show the rectangles x0, y0, x1, y1 in page coordinates"""
+        self.setPolygons([QPolygonF(QRectF(QPointF(x0, y0), QPointF(x1, y1)))
+                          for x0, y0, x1, y1 in rects.tolist()])
+
 class MouseInteraction:
 
     class InteractionType(Enum):
@@ -554,6 +1908,782 @@ class MouseInteraction:
     def interaction(self, i: InteractionType):
         self._interaction = i
 
+################################################################################
+#                             Rendering
+################################################################################
+
+class PageSizeTable:
+    """
+        Page rectangles of a document, read lazily.
+
+        PDF page sizes come from the page cropbox and the /Rotate entry, inherited from the page tree
+        when missing, without loading the pages.
+    """
+    def __init__(self, doc: pymupdf.Document = None):
+        self._document = doc
+        self._is_pdf = doc is not None and doc.is_pdf
+        self._rects: list[pymupdf.Rect | None] = [None] * (len(doc) if doc is not None else 0)
+        self._rotations: dict[int, int] = {}  # inherited /Rotate of the pages nodes
+
+    def rect(self, pno: int) -> pymupdf.Rect:
+        rect = self._rects[pno]
+        if rect is None:
+            rect = self._rects[pno] = self._readRect(pno)
+        return rect
+
+    def rects(self) -> list[pymupdf.Rect]:
+        return [self.rect(pno) for pno in range(len(self._rects))]
+
+    def _readRect(self, pno: int) -> pymupdf.Rect:
+        if not self._is_pdf:
+            return self._document.load_page(pno).rect
+
+        cropbox = self._document.page_cropbox(pno)
+        width, height = cropbox.width, cropbox.height
+        if self._rotation(self._document.page_xref(pno)) % 180 == 90:
+            width, height = height, width
+        return pymupdf.Rect(0, 0, width, height)
+
+    def _rotation(self, xref: int) -> int:
+        """/Rotate of a page or pages node, inherited from its /Parent nodes when missing"""
+        rotation = self._rotations.get(xref)
+        if rotation is None:
+            kind, value = self._document.xref_get_key(xref, "Rotate")
+            if kind == "int":
+                rotation = int(value)
+            else:
+                kind, parent = self._document.xref_get_key(xref, "Parent")
+                rotation = self._rotation(int(parent.split()[0])) if kind == "xref" else 0
+            if self._document.xref_get_key(xref, "Type")[1] == "/Pages":
+                self._rotations[xref] = rotation  # shared by the pages below
+        return rotation
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+
+@dataclass
+class RenderJob:
+    """Parameters of a page rasterization"""
+
+    class Kind(Enum):
+        PAGE = 0
+        TILE = 1
+        PREFETCH = 2
+
+    pno: int
+    zoom: float = 1.0
+    dpr: float = 1.0
+    rotation: int = 0
+    generation: int = 0
+    kind: Kind = Kind.PAGE
+    clip: tuple | None = None  # page area to render, in page coordinates
+    tile: tuple | None = None  # (column, row) of the tile
+
+    def key(self) -> tuple:
+        """Cache key of the rendered image"""
+        return (self.pno, round(self.zoom, 4), self.dpr, self.rotation, self.tile)
+
+
+def zoomBucket(zoom: float) -> float:
+    """Zoom factor the tiles are rendered at: the next quarter power of two"""
+    return 2 ** (math.ceil(round(math.log2(zoom) * 4, 6)) / 4)
+
+
+class RenderStats:
+    """
+        Timings of the render pipeline stages and counters, updated from the GUI and worker threads.
+        Components with their own statistics are added as sources, callables returning a dict,
+        merged into snapshot().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sources: dict[str, callable] = {}
+        self.reset()
+
+    def reset(self, document: dict | None = None):
+        """Clear the timings and counters, document describes what they will be about"""
+        with self._lock:
+            self._document = document or {}
+            self._stages: dict[str, list] = {}  # name -> [count, total, max] in seconds
+            self._counters: dict[str, int] = {}
+            self._started = time.time()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            stage_stats = self._stages.setdefault(stage, [0, 0.0, 0.0])
+            stage_stats[0] += 1
+            stage_stats[1] += seconds
+            stage_stats[2] = max(stage_stats[2], seconds)
+
+    @contextmanager
+    def timed(self, stage: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - t0)
+
+    def count(self, counter: str, n: int = 1):
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + n
+
+    def addSource(self, name: str, source: callable):
+        self._sources[name] = source
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            stages = {name: {"count": count,
+                             "total_s": total,
+                             "mean_ms": 1000 * total / count,
+                             "max_ms": 1000 * longest}
+                      for name, (count, total, longest) in self._stages.items()}
+            counters = dict(self._counters)
+            snapshot = {"document": dict(self._document),
+                        "started": self._started,
+                        "elapsed_s": time.time() - self._started}
+
+        search = stages.get("search")
+        if search is not None and search["total_s"] > 0:
+            counters["search_pages_per_second"] = counters.get("search_pages", 0) / search["total_s"]
+
+        snapshot.update({"stages": stages, "counters": counters})
+        snapshot.update({name: source() for name, source in self._sources.items()})
+        return snapshot
+
+    def toJson(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def exportJson(self, path: str):
+        with open(path, "w") as f:
+            f.write(self.toJson())
+
+    def summary(self) -> str:
+        """Short text of the stages and counters, for display"""
+        snapshot = self.snapshot()
+        lines = [f"{name}: {stage['count']} x {stage['mean_ms']:.1f} ms (max {stage['max_ms']:.1f})"
+                 for name, stage in snapshot["stages"].items()]
+        lines += [f"{name}: {value:.0f}" for name, value in snapshot["counters"].items()]
+        return "\n".join(lines)
+
+
+class PageImageCache:
+    """
+        LRU cache of rendered page pixmaps bounded by a memory budget in bytes.
+
+        Hits, misses and evictions are counted; see stats().
+    """
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self._pixmaps: OrderedDict[tuple, QPixmap] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def sizeOf(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def maxBytes(self) -> int:
+        return self._max_bytes
+
+    def setMaxBytes(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def get(self, key: tuple) -> QPixmap | None:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key: tuple, pixmap: QPixmap):
+        if key in self._pixmaps:
+            self._bytes -= self.sizeOf(self._pixmaps.pop(key))
+        size = self.sizeOf(pixmap)
+        if size > self._max_bytes:
+            return
+        self._pixmaps[key] = pixmap
+        self._bytes += size
+        self._evict()
+
+    def _evict(self):
+        while self._bytes > self._max_bytes and self._pixmaps:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._bytes -= self.sizeOf(pixmap)
+            self.evictions += 1
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._pixmaps
+
+    def nearest(self, key: tuple) -> tuple[tuple, QPixmap] | None:
+        """Return the (key, pixmap) entry differing from key by its zoom only, with the closest zoom"""
+        pno, zoom = key[:2]
+        best = None
+        for other, pixmap in self._pixmaps.items():
+            if other[0] == pno and other[2:] == key[2:]:
+                if best is None or abs(other[1] - zoom) < abs(best[0][1] - zoom):
+                    best = (other, pixmap)
+        return best
+
+    def clear(self):
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "count": len(self._pixmaps),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes}
+
+
+class DisplayListCache:
+    """
+        LRU cache of page DisplayLists bounded by a number of pages.
+
+        Pinned pages (typically the visible page and its neighbours) are never evicted.
+        Shared by the render worker and the GUI thread.
+    """
+    def __init__(self, max_pages: int = 16):
+        self._document: pymupdf.Document = None
+        self._dlists: OrderedDict[int, pymupdf.DisplayList] = OrderedDict()
+        self._pinned: set[int] = set()
+        self._max_pages = max_pages
+        self._lock = threading.RLock()
+        self.stats = RenderStats()
+
+    def setDocument(self, doc: pymupdf.Document):
+        with self._lock:
+            self._document = doc
+            self._dlists.clear()
+            self._pinned.clear()
+
+    def maxPages(self) -> int:
+        return self._max_pages
+
+    def setMaxPages(self, max_pages: int):
+        with self._lock:
+            self._max_pages = max_pages
+            self._evict()
+
+    def lock(self) -> threading.RLock:
+        """Lock held while reading the document, for the other threads reading it"""
+        return self._lock
+
+    def get(self, pno: int) -> pymupdf.DisplayList:
+        """Return the DisplayList of the page, creating it if not yet there"""
+        with self._lock:
+            page_dlist = self._dlists.get(pno)
+
+            if page_dlist is None:
+                with self.stats.timed("load_page"):
+                    fitzpage = self._document.load_page(pno)
+                with self.stats.timed("display_list"):
+                    page_dlist = fitzpage.get_displaylist()
+                self._dlists[pno] = page_dlist
+                self._evict()
+                self.stats.count("display_list_misses")
+            else:
+                self._dlists.move_to_end(pno)
+                self.stats.count("display_list_hits")
+            return page_dlist
+
+    def pin(self, pnos):
+        """Replace the set of pages protected from eviction"""
+        with self._lock:
+            self._pinned = set(pnos)
+            self._evict()
+
+    def _evict(self):
+        for pno in list(self._dlists):
+            if len(self._dlists) <= self._max_pages:
+                break
+            if pno not in self._pinned:
+                del self._dlists[pno]
+
+    def __contains__(self, pno: int) -> bool:
+        return pno in self._dlists
+
+    def __len__(self) -> int:
+        return len(self._dlists)
+
+    def clear(self):
+        with self._lock:
+            self._dlists.clear()
+
+
+class TextPageCache:
+    """
+        LRU cache of the TextPages of the pages, bounded by a number of pages, shared by the
+        text selection, the search and the link labels so that a page is parsed once.
+
+        get() returns the page with its TextPage, which only keeps a weak reference on it and
+        must be used with that page object. Used from the GUI and the search worker threads.
+    """
+    flags = pymupdf.TEXTFLAGS_SEARCH  # search_for default, also fine for get_textbox
+
+    def __init__(self, max_pages: int = 64):
+        self._document: pymupdf.Document = None
+        self._textpages: OrderedDict[int, tuple[pymupdf.Page, pymupdf.TextPage]] = OrderedDict()
+        self._max_pages = max_pages
+        self._lock = threading.RLock()
+        self.stats = RenderStats()
+
+    def setDocument(self, doc: pymupdf.Document):
+        """Clear the cache for doc, kept when doc is already the cached document"""
+        with self._lock:
+            if doc is not self._document:
+                self._document = doc
+                self._textpages.clear()
+
+    def maxPages(self) -> int:
+        return self._max_pages
+
+    def setMaxPages(self, max_pages: int):
+        with self._lock:
+            self._max_pages = max_pages
+            self._evict()
+
+    def get(self, pno: int, keep: bool = True) -> tuple[pymupdf.Page, pymupdf.TextPage]:
+        """
+            Return the page and its TextPage, extracting it if not yet there.
+            With keep False, a cached TextPage is reused but a new one is not stored and
+            the LRU order is left as is: a scan of the whole document evicts nothing.
+        """
+        with self._lock:
+            entry = self._textpages.get(pno)
+            if entry is None:
+                with self.stats.timed("textpage"):
+                    page = self._document.load_page(pno)
+                    entry = (page, page.get_textpage(flags=self.flags))
+                if keep:
+                    self._textpages[pno] = entry
+                    self._evict()
+                self.stats.count("textpage_misses")
+            else:
+                if keep:
+                    self._textpages.move_to_end(pno)
+                self.stats.count("textpage_hits")
+            return entry
+
+    def _evict(self):
+        while len(self._textpages) > self._max_pages:
+            self._textpages.popitem(last=False)
+
+    def __contains__(self, pno: int) -> bool:
+        return pno in self._textpages
+
+    def __len__(self) -> int:
+        return len(self._textpages)
+
+    def clear(self):
+        with self._lock:
+            self._textpages.clear()
+
+
+class RenderDiskCache:
+    """
+        Rendered pages and tiles kept across sessions in the cache directory, in a directory
+        per document fingerprint, one file of zlib compressed samples per RenderJob key.
+        Files are named after the zoom bucket of the job and hold the render at that zoom,
+        so that pages shown at nearby zoom factors share them like the tiles do.
+
+        Files are touched when read and the least recently used ones are deleted once the
+        cache grows over max_bytes. Used from the RenderScheduler worker thread.
+    """
+    MAGIC = b"PQRC"
+    HEADER = struct.Struct("<4sIIB?")  # magic, width, height, n, alpha
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, compression: int = 1):
+        self._limit = CacheDirectoryLimit("render", max_bytes)
+        self._compression = compression
+        self._enabled = True
+        self._source: DocumentSource = ""
+        self._fingerprint: str = None
+        self._directory: str = None
+
+    def setDocument(self, source: DocumentSource = "", fingerprint: str = None):
+        """source is the file path or buffer of the document, fingerprint its documentFingerprint if known"""
+        self._source = source
+        self._fingerprint = fingerprint
+        self._directory = None
+        if not source or not self._enabled:
+            return
+
+        try:
+            if self._fingerprint is None:
+                self._fingerprint = documentFingerprint(source)
+            directory = os.path.join(cacheDirectory("render"), self._fingerprint)
+            os.makedirs(directory, exist_ok=True)
+            self._directory = directory
+        except OSError as e:
+            logger.error(f"Cannot use the render cache: {e}")
+
+    def directory(self) -> str | None:
+        """Cache directory of the current document, None when disabled"""
+        return self._directory
+
+    def isEnabled(self) -> bool:
+        return self._enabled
+
+    def setEnabled(self, enabled: bool):
+        self._enabled = enabled
+        self.setDocument(self._source, self._fingerprint)
+
+    def maxBytes(self) -> int:
+        return self._limit.maxBytes()
+
+    def setMaxBytes(self, max_bytes: int):
+        self._limit.setMaxBytes(max_bytes)
+
+    @staticmethod
+    def fileName(job: RenderJob) -> str:
+        pno, zoom, dpr, rotation, tile = job.key()
+        name = f"{pno}_{zoomBucket(zoom):g}_{dpr:g}_{rotation}"
+        if tile is not None:
+            name = name + "_" + "_".join(str(i) for i in tile)
+        return name + ".pqrc"
+
+    def get(self, directory: str, job: RenderJob) -> pymupdf.Pixmap | None:
+        path = os.path.join(directory, self.fileName(job))
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error(f"Cannot read {path}: {e}")
+            return None
+
+        try:
+            magic, width, height, n, alpha = self.HEADER.unpack_from(data)
+            if magic != self.MAGIC:
+                raise ValueError("not a render cache file")
+            samples = zlib.decompress(memoryview(data)[self.HEADER.size:])
+            colorspace = pymupdf.csGRAY if n - alpha == 1 else pymupdf.csRGB
+            fitzpix = pymupdf.Pixmap(colorspace, width, height, samples, alpha)
+            os.utime(path)
+            return fitzpix
+        except (OSError, ValueError, RuntimeError, struct.error, zlib.error) as e:
+            logger.error(f"Cannot load {path}: {e}")
+            return None
+
+    def put(self, directory: str, job: RenderJob, fitzpix: pymupdf.Pixmap):
+        """Store fitzpix, rendered at the zoom bucket of job"""
+        if fitzpix.n - fitzpix.alpha not in (1, 3):
+            return
+
+        data = (self.HEADER.pack(self.MAGIC, fitzpix.width, fitzpix.height, fitzpix.n, bool(fitzpix.alpha))
+                + zlib.compress(fitzpix.samples_mv, self._compression))
+        path = os.path.join(directory, self.fileName(job))
+        try:
+            replaced_bytes = os.path.getsize(path)
+        except OSError:
+            replaced_bytes = 0
+        try:
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            logger.error(f"Cannot write {path}: {e}")
+            return
+
+        self._limit.written(len(data), replaced_bytes)
+
+    def cleanup(self):
+        """Delete the least recently used files until the cache is under 90% of max_bytes"""
+        self._limit.cleanup()
+
+
+class RenderScheduler(QObject):
+    """
+        Rasterize pages on a worker thread and deliver QImages through sigRendered.
+
+        Each job carries the generation token of its kind. Submitting new
+        page or tile jobs makes the pending ones of the same kind stale: the
+        worker skips them and drops their results. Prefetch jobs only run
+        when no page or tile requested by the view is waiting. Pages whose
+        prefetch takes longer than prefetch_budget are not prefetched again.
+        Between the bands of a large render, a prefetch job is put back in
+        the queue when a view job arrives and abandoned past the budget.
+    """
+    sigRendered = Signal(object, object)  # RenderJob, QImage
+
+    PRIORITY_STOP = -1
+    PRIORITY_VIEW = 0
+    PRIORITY_PREFETCH = 1
+
+    prefetch_budget = 0.15  # seconds of drawing allowed to a speculative job
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._document: pymupdf.Document = None
+        self.stats = RenderStats()
+        self.dlist_cache = DisplayListCache()
+        self.dlist_cache.stats = self.stats
+        self.disk_cache = RenderDiskCache()
+        self._generations: dict[RenderJob.Kind, int] = dict.fromkeys(RenderJob.Kind, 0)
+        self._sequence = itertools.count()
+        self._jobs = queue.PriorityQueue()
+        self._stopped = threading.Event()
+        self._expensive_pages: set[int] = set()  # pages over the prefetch budget
+
+        self._worker = threading.Thread(target=self._run, name="RenderScheduler", daemon=True)
+        self._worker.start()
+        stopOnDestroyed(self, self.stop, self._worker)
+
+    def setDocument(self, doc: pymupdf.Document, source: DocumentSource = "", fingerprint: str = None):
+        self.cancelAll()
+        self._document = doc
+        self._expensive_pages = set()
+        self.dlist_cache.setDocument(doc)
+        self.disk_cache.setDocument(source, fingerprint)
+
+    def displayListCache(self) -> DisplayListCache:
+        return self.dlist_cache
+
+    def diskCache(self) -> RenderDiskCache:
+        return self.disk_cache
+
+    def _submit(self, jobs: list[RenderJob], kind: RenderJob.Kind, priority: int):
+        generation = self._generations[kind]
+        for job in jobs:
+            job.kind = kind
+            job.generation = generation
+            self._jobs.put((priority, next(self._sequence), job))
+
+    def render(self, job: RenderJob) -> RenderJob:
+        """Queue a page rasterization, superseding the pending ones"""
+        self.cancel(RenderJob.Kind.PAGE)
+        self._submit([job], RenderJob.Kind.PAGE, self.PRIORITY_VIEW)
+        return job
+
+    def renderPages(self, jobs: list[RenderJob]) -> list[RenderJob]:
+        """Queue several page rasterizations, superseding the pending ones"""
+        self.cancel(RenderJob.Kind.PAGE)
+        self._submit(jobs, RenderJob.Kind.PAGE, self.PRIORITY_VIEW)
+        return jobs
+
+    def renderTiles(self, jobs: list[RenderJob]) -> list[RenderJob]:
+        """Queue tile rasterizations, superseding the pending tiles"""
+        self.cancel(RenderJob.Kind.TILE)
+        self._submit(jobs, RenderJob.Kind.TILE, self.PRIORITY_VIEW)
+        return jobs
+
+    def prefetch(self, job: RenderJob) -> RenderJob:
+        """Queue a speculative page rasterization at idle priority, unless the page is too expensive"""
+        if job.pno in self._expensive_pages:
+            self.stats.count("prefetch_skipped")
+            return job
+        self._submit([job], RenderJob.Kind.PREFETCH, self.PRIORITY_PREFETCH)
+        return job
+
+    def cancel(self, kind: RenderJob.Kind = RenderJob.Kind.PAGE):
+        """Drop the pending jobs of this kind"""
+        self._generations[kind] += 1
+
+    def cancelPrefetch(self):
+        """Drop the pending prefetch jobs"""
+        self.cancel(RenderJob.Kind.PREFETCH)
+
+    def cancelAll(self):
+        for kind in RenderJob.Kind:
+            self.cancel(kind)
+
+    def isStale(self, job: RenderJob) -> bool:
+        return job.generation != self._generations[job.kind]
+
+    def viewJobWaiting(self) -> bool:
+        with self._jobs.mutex:
+            return bool(self._jobs.queue) and self._jobs.queue[0][0] < self.PRIORITY_PREFETCH
+
+    def _prefetchCancelled(self, job: RenderJob, deadline: float) -> bool:
+        """Requeue the prefetch job behind the view jobs, or give up on it past the deadline"""
+        if self.viewJobWaiting():
+            self.stats.count("prefetch_preempted")
+            self._jobs.put((self.PRIORITY_PREFETCH, next(self._sequence), job))
+            return True
+        if time.perf_counter() > deadline:
+            self.stats.count("prefetch_over_budget")
+            self._expensive_pages.add(job.pno)
+            return True
+        return False
+
+    def createFitzpix(self, page_dlist: pymupdf.DisplayList, job: RenderJob,
+                      zoom: float = None) -> pymupdf.Pixmap | None:
+        """
+            Create pymupdf.Pixmap applying zoom factor, device pixel ratio, rotation and clip,
+            at zoom instead of job.zoom if given.
+            Returns None when the job became stale, the scheduler stopped or a prefetch job
+            was preempted while drawing it.
+        """
+        zf = (zoom or job.zoom) * job.dpr
+        mat = pymupdf.Matrix(zf, zf).prerotate(job.rotation)
+        clip = pymupdf.Rect(job.clip) if job.clip is not None else None
+        started = time.perf_counter()
+        deadline = started + self.prefetch_budget
+
+        def cancelled() -> bool:
+            if self.isStale(job) or self._stopped.is_set():
+                return True
+            return job.kind == RenderJob.Kind.PREFETCH and self._prefetchCancelled(job, deadline)
+
+        fitzpix = drawInBands(page_dlist, mat, clip, cancelled)
+        if (fitzpix is not None and job.kind == RenderJob.Kind.PREFETCH
+                and time.perf_counter() - started > self.prefetch_budget):
+            self.stats.count("prefetch_over_budget")
+            self._expensive_pages.add(job.pno)
+        return fitzpix
+
+    def stop(self):
+        self.cancelAll()
+        self._stopped.set()
+        self._jobs.put((self.PRIORITY_STOP, next(self._sequence), None))
+
+    def _run(self):
+        while True:
+            job: RenderJob
+            _, _, job = self._jobs.get()
+            if job is None:
+                break
+            if self.isStale(job):
+                self.stats.count("stale_jobs")
+                continue
+
+            directory = self.disk_cache.directory()
+            # the disk cache holds renders at the zoom bucket, scaled down to the zoom of the job
+            zoom = zoomBucket(job.zoom) if directory is not None else job.zoom
+            try:
+                fitzpix = None
+                if directory is not None:
+                    with self.stats.timed("disk_cache_read"):
+                        fitzpix = self.disk_cache.get(directory, job)
+                    self.stats.count("disk_cache_hits" if fitzpix is not None else "disk_cache_misses")
+                cached = fitzpix is not None
+
+                if not cached:
+                    page_dlist = self.dlist_cache.get(job.pno)
+                    with self.stats.timed("rasterize"):
+                        fitzpix = self.createFitzpix(page_dlist, job, zoom)
+                    if fitzpix is None:
+                        if self.isStale(job):
+                            self.stats.count("stale_jobs")
+                        continue
+                    self.stats.count("bytes_rasterized", fitzpix.samples_mv.nbytes)
+
+                shown = fitzpix
+                if zoom != job.zoom:
+                    with self.stats.timed("scale"):
+                        ratio = job.zoom / zoom
+                        shown = pymupdf.Pixmap(fitzpix, max(1, round(fitzpix.width * ratio)),
+                                               max(1, round(fitzpix.height * ratio)), None)
+                with self.stats.timed("to_qimage"):
+                    image = toQImage(shown)
+            except Exception:
+                if not self.isStale(job):  # a document swap may invalidate the job
+                    logger.exception(f"Cannot render page {job.pno}")
+                continue
+
+            self.stats.count(f"renders_{job.kind.name.lower()}")
+            if not self.isStale(job):
+                try:
+                    self.sigRendered.emit(job, image)
+                except RuntimeError:  # scheduler deleted
+                    break
+            else:
+                self.stats.count("stale_jobs")
+
+            if directory is not None and not cached:
+                with self.stats.timed("disk_cache_write"):
+                    self.disk_cache.put(directory, job, fitzpix)
+
+
+class Prefetcher:
+    """
+        Render the pages ahead of the reading direction before the user gets there.
+
+        The number of pages rendered ahead grows with the navigation velocity
+        (pages/s) up to twice the configured depth. A change of direction
+        cancels the pending prefetch jobs.
+    """
+    def __init__(self, scheduler: RenderScheduler, page_cache: PageImageCache, job_factory, depth: int = 2):
+        self._scheduler = scheduler
+        self._page_cache = page_cache
+        self._job_factory = job_factory  # callable(pno) -> RenderJob
+        self._depth = depth
+        self._page_count = 0
+        self._last_pno: int = None
+        self._last_time: float = 0.0
+        self._direction: int = 1
+        self._velocity: float = 0.0
+        self._queued: set[tuple] = set()
+
+    def depth(self) -> int:
+        return self._depth
+
+    def setDepth(self, depth: int):
+        self._depth = depth
+        if depth == 0:
+            self.cancel()
+
+    def setDocument(self, doc: pymupdf.Document):
+        self._page_count = len(doc)
+        self._last_pno = None
+        self._direction = 1
+        self._velocity = 0.0
+        self._queued.clear()
+
+    def cancel(self):
+        self._scheduler.cancelPrefetch()
+        self._queued.clear()
+
+    def direction(self) -> int:
+        return self._direction
+
+    def velocity(self) -> float:
+        return self._velocity
+
+    def pageChanged(self, current_pno: int):
+        """Prefetch the pages following current_pno in the reading direction"""
+        now = time.monotonic()
+
+        if self._last_pno is not None and current_pno != self._last_pno:
+            delta = current_pno - self._last_pno
+            direction = 1 if delta > 0 else -1
+            if direction != self._direction:
+                self.cancel()
+                self._direction = direction
+                self._velocity = 0.0
+            elapsed = max(now - self._last_time, 1e-3)
+            self._velocity = 0.5 * self._velocity + 0.5 * abs(delta) / elapsed
+
+        self._last_pno = current_pno
+        self._last_time = now
+
+        if self._depth <= 0:
+            return
+
+        ahead = min(2 * self._depth, self._depth + int(self._velocity))
+        queued = set()
+        for i in range(1, ahead + 1):
+            pno = current_pno + i * self._direction
+            if not 0 <= pno < self._page_count:
+                break
+            job: RenderJob = self._job_factory(pno)
+            key = job.key()
+            if key not in self._page_cache and key not in self._queued:
+                self._scheduler.prefetch(job)
+            queued.add(key)
+        self._queued = queued
+
+
 ################################################################################
 #                             View
 ################################################################################
@@ -563,6 +2693,18 @@ class PdfView(QGraphicsView):
     sig_annotation_added = Signal(object)
     sig_annotation_removed = Signal('qint64')
     sig_annotation_selected = Signal(object)
+    sigRenderStats = Signal(object)  # RenderStats, after each rendered page or tile
+
+    class LayoutMode(Enum):
+        SinglePage = 0
+        Continuous = 1
+
+    page_spacing = 10  # scene pixels between pages in continuous layout
+    tile_size = 512  # device pixels
+    tile_threshold = 4096 * 4096  # device pixels of a page above which it is rendered in tiles
+    tile_backdrop_pixels = 2048 * 2048  # device pixels of the preview drawn under the tiles
+    zoom_settle_ms = 150  # quiet period after the last wheel or pinch event before rendering
+    glyph_pages = 8  # pages whose PageGlyphs are kept for text selection
 
     def __init__(self, parent=None):
         super(PdfView, self).__init__(parent)
@@ -580,7 +2722,13 @@ class PdfView(QGraphicsView):
         self.b1 = QPointF()
 
         self.graphic_items = {} # dict of QGraphicItem
-        self.link_boxes = {} # {pno:[RectItems]}
+        self.link_layers: dict[int, LinkLayer] = {}  # link items of the shown pages
+        self.page_links: dict[int, PageLinks] = {}  # link geometry of the visited pages
+        self.page_glyphs: OrderedDict[int, PageGlyphs] = OrderedDict()  # character boxes for text selection
+        self._selection_anchor = 0  # caret where the text selection started
+        self._selection_caret = 0
+        self.page_layers: dict[int, PageLayer] = {}
+        self._shown_layers: set[int] = set()
         self._current_graphic_item = None
 
         self.setMouseTracking(True)
@@ -590,14 +2738,47 @@ class PdfView(QGraphicsView):
         self._zoom_selector = ZoomSelector(parent)
 
         self.page_count: int = 0
-        self.page_dlist: pymupdf.DisplayList = None
+        self.page_sizes = PageSizeTable()
+        self._rendering: RenderJob = None  # job in flight
+        self._scroll_to: int = None  # scroll location to apply once the page is rendered
+        self._shown_job: RenderJob = None  # job of the displayed pixmap
+        self._shown_zoom: float = None  # zoom factor the displayed page is scaled to
+
+        self.tile_items: dict[tuple, QGraphicsPixmapItem] = {}  # {(column, row): item}
+        self._tiles_key: tuple = None  # (pno, zoom bucket) of the tile items
+        self._pending_tiles: set[tuple] = set()
+
+        # Continuous layout
+        self._layout_mode = PdfView.LayoutMode.SinglePage
+        self._layout_zoom: float = None  # zoom factor of the page layout
+        self._layout_width: float = 0.0
+        self._page_tops: list[float] = []  # scene y of each page
+        self.page_items: dict[int, QGraphicsPixmapItem] = {}  # pixmap items of the pages near the viewport
+        self._page_item_keys: dict[int, tuple] = {}  # key of the pixmap shown by each page item
+        self._page_item_pool: list[QGraphicsPixmapItem] = []
+        self._pending_pages: set[tuple] = set()
+        self._visible_pages: tuple = ()
+        self._tracking_scroll: bool = False  # current page changed by scrolling
+        self._scrolling_to_page: bool = False
  
-        self.annotations = {}
+        self.annotations = {}  # {pno: [pymupdf.Quad]} highlighted over the pages
+        self.highlight_items: dict[int, HighlightItem] = {}
+
+        self.page_cache = PageImageCache()
+        self.tile_cache = PageImageCache(128 * 1024 * 1024)
+        self.render_scheduler = RenderScheduler(self)
+        self.render_scheduler.sigRendered.connect(self.onPageRendered)
+        self.render_scheduler.stats.addSource("page_cache", self.page_cache.stats)
+        self.render_scheduler.stats.addSource("tile_cache", self.tile_cache.stats)
+        self.prefetcher = Prefetcher(self.render_scheduler, self.page_cache, self.createRenderJob)
+        self.text_cache = TextPageCache()
+        self.text_cache.stats = self.render_scheduler.stats
 
         self.doc_scene = QGraphicsScene(self)
         self.setScene(self.doc_scene)
 
         self.page_pixmap_item = self.createPixmapItem()
+        self.page_pixmap_item.setZValue(-2)  # below the tiles
         self.doc_scene.addItem(self.page_pixmap_item)
 
         self.setBackgroundBrush(QColor(242, 242, 242))
@@ -609,15 +2790,47 @@ class PdfView(QGraphicsView):
 
         self._page_navigator.currentPnoChanged.connect(self.renderPage) # Render page at init time
         self._page_navigator.currentLocationChanged.connect(self.scrollTo)
+        self._zoom_selector.zoomFactorChanged.connect(self.onZoomFactorChanged)
+        self._zoom_selector.zoomModeChanged.connect(self.setZoomMode)
+        self.horizontalScrollBar().valueChanged.connect(self.onViewportChanged)
+        self.verticalScrollBar().valueChanged.connect(self.onViewportChanged)
+
+        # Wheel and pinch zoom: the view is scaled until the input settles, then rendered once
+        self._pending_zoom: float = None
+        self._zoom_anchor = QPoint()  # viewport position kept under the pointer
+        self._zoom_base_transform = QTransform()
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(self.zoom_settle_ms)
+        self._zoom_timer.timeout.connect(self.commitZoom)
+        self.viewport().grabGesture(Qt.GestureType.PinchGesture)
     
     def showEvent(self, event: QShowEvent | None) -> None:
         return super().showEvent(event)
     
-    def setDocument(self, doc: pymupdf.Document):
+    def setDocument(self, doc: pymupdf.Document, source: DocumentSource = "", fingerprint: str = None):
+        """
+            Show doc, source, the file path or buffer doc was opened from, enables the render disk cache.
+            fingerprint is its documentFingerprint, computed by the cache when None.
+        """
+        self.cancelZoomPreview()
         self.fitzdoc: pymupdf.Document = doc
         self._page_navigator.setDocument(self.fitzdoc)
         self.page_count = len(self.fitzdoc)
-        self.dlist: list[pymupdf.DisplayList] = [None] * self.page_count
+        self.page_sizes = PageSizeTable(self.fitzdoc)
+        self._shown_job = None
+        self._shown_zoom = None
+        self._layout_zoom = None
+        self.clearTiles()
+        self.releasePageItems()
+        self.page_cache.clear()
+        self.tile_cache.clear()
+        self.setAnnotations({})
+        self.clearPageLayers()
+        self.render_scheduler.setDocument(self.fitzdoc, source, fingerprint)
+        self.render_scheduler.stats.reset({"name": doc.name, "page_count": self.page_count})
+        self.text_cache.setDocument(self.fitzdoc)
+        self.prefetcher.setDocument(self.fitzdoc)
         self._page_navigator._setCurrentPno(0)
 
     def pageNavigator(self) -> PageNavigator:
@@ -625,16 +2838,56 @@ class PdfView(QGraphicsView):
     
     def zoomSelector(self) -> ZoomSelector:
         return self._zoom_selector
+
+    def pageCache(self) -> PageImageCache:
+        return self.page_cache
+
+    def textPageCache(self) -> TextPageCache:
+        return self.text_cache
+
+    def renderStats(self) -> RenderStats:
+        return self.render_scheduler.stats
+
+    def layoutMode(self) -> LayoutMode:
+        return self._layout_mode
+
+    @Slot(LayoutMode)
+    def setLayoutMode(self, mode: LayoutMode):
+        """Display one page at a time or all the pages one below the other"""
+        if mode == self._layout_mode:
+            return
+
+        self.cancelZoomPreview()
+        self._layout_mode = mode
+        self._layout_zoom = None
+        self._shown_job = None
+        self._shown_zoom = None
+        self._rendering = None
+        self.clearTiles()
+        self.releasePageItems()
+        self.page_pixmap_item.setVisible(mode == PdfView.LayoutMode.SinglePage)
+
+        if self.page_count > 0:
+            self.renderPage(self.pageNavigator().currentPno())
+
+    def isContinuous(self) -> bool:
+        return self._layout_mode == PdfView.LayoutMode.Continuous
+
+    def setPrefetchDepth(self, depth: int):
+        """Number of pages rendered ahead of the reading direction, 0 to disable"""
+        self.prefetcher.setDepth(depth)
     
     @Slot(ZoomSelector.ZoomMode)
     def setZoomMode(self, mode: ZoomSelector.ZoomMode):
+        self.cancelZoomPreview()
         view_width = self.width()
         view_height = self.height()
 
         content_margins = self.contentsMargins()
 
-        page_width = self.dlist[self.pageNavigator().currentPno()].rect.width
-        page_height = self.dlist[self.pageNavigator().currentPno()].rect.height
+        page_rect = self.pageRect(self.pageNavigator().currentPno())
+        page_width = page_rect.width
+        page_height = page_rect.height
         
         if mode == ZoomSelector.ZoomMode.FitToWidth:
             self._zoom_selector.zoomFactor = (view_width - content_margins.left() - content_margins.right() - 20) / page_width
@@ -643,6 +2896,14 @@ class PdfView(QGraphicsView):
             self._zoom_selector.zoomFactor = (view_height - content_margins.bottom() - content_margins.top() - 20) / page_height
             self.renderPage(self.pageNavigator().currentPno())
     
+    @Slot(float)
+    def onZoomFactorChanged(self, factor: float):
+        """Zoom factor entered in the zoom selector"""
+        if abs(factor - self._zoom_selector.zoomFactor) < 0.01:  # rounded echo of the current zoom
+            return
+        self._zoom_selector.zoomFactor = factor
+        self.renderPage(self.pageNavigator().currentPno())
+
     @Slot()
     def zoomIn(self):
         self._zoom_selector.zoomIn()
@@ -653,13 +2914,67 @@ class PdfView(QGraphicsView):
         self._zoom_selector.zoomOut()
         self.renderPage(self.pageNavigator().currentPno())
 
+    def isZooming(self) -> bool:
+        """A wheel or pinch zoom is previewed and waits for the input to settle"""
+        return self._pending_zoom is not None
+
+    def previewZoom(self, zoom: float, anchor: QPoint):
+        """
+            Scale the view to zoom, keeping the scene point under the viewport position anchor,
+            and defer the render until no zoom input arrived for zoom_settle_ms
+        """
+        zoom = min(max(zoom, ZoomSelector.min_zoom_factor), ZoomSelector.max_zoom_factor)
+        if self._pending_zoom is None:
+            self._zoom_base_transform = self.transform()
+
+        scene_pos = self.mapToScene(anchor)
+        transform = QTransform(self._zoom_base_transform)
+        ratio = zoom / self._zoom_selector.zoomFactor
+        transform.scale(ratio, ratio)
+        self.setTransform(transform)
+        self.scrollBy(self.mapFromScene(scene_pos) - anchor)
+
+        self._pending_zoom = zoom
+        self._zoom_anchor = anchor
+        self._zoom_timer.start()
+
+    @Slot()
+    def commitZoom(self):
+        """Render once at the zoom reached by the wheel or pinch gesture"""
+        if self._pending_zoom is None:
+            return
+
+        zoom = self._pending_zoom
+        anchor = self._zoom_anchor
+        scene_pos = self.mapToScene(anchor)
+        pno = self.pageAt(scene_pos)
+        page_point = (scene_pos - self.pageOffset(pno)) / self._zoom_selector.zoomFactor
+
+        # Restore the transform while still zooming, the viewport is updated at the new zoom only
+        self._zoom_timer.stop()
+        self.setTransform(self._zoom_base_transform)
+        self._zoom_selector.zoomFactor = zoom
+        self._pending_zoom = None
+        self.renderPage(self.pageNavigator().currentPno())
+        self.scrollBy(self.mapFromScene(self.pageOffset(pno) + page_point * zoom) - anchor)
+
+    def cancelZoomPreview(self):
+        """Drop the pending wheel or pinch zoom and restore the view transform"""
+        if self._pending_zoom is None:
+            return
+        self._zoom_timer.stop()
+        self._pending_zoom = None
+        self.setTransform(self._zoom_base_transform)
+
+    def scrollBy(self, delta: QPoint):
+        self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() + delta.x())
+        self.verticalScrollBar().setValue(self.verticalScrollBar().value() + delta.y())
+
     def toQPixmap(self, fitzpix:pymupdf.Pixmap) -> QPixmap:
         """Convert pymupdf.Pixmap to QtGui.QPixmap"""
-        fitzpix_bytes = fitzpix.tobytes()
-        pixmap = QPixmap()
-        r = pixmap.loadFromData(fitzpix_bytes)
+        pixmap = QPixmap.fromImage(toQImage(fitzpix))
         pixmap.setDevicePixelRatio(self.dpr)
-        if not r:
+        if pixmap.isNull():
             logger.error(f"Cannot load pixmap from data")
         return pixmap
     
@@ -672,78 +2987,479 @@ class PdfView(QGraphicsView):
             item.setTransform(matrix)
         return item
     
-    def createFitzpix(self, page_dlist: pymupdf.DisplayList, zoom_factor=1) -> pymupdf.Pixmap:
-        """Create pymupdf.Pixmap applying zoom factor"""
-        zf = zoom_factor * self.dpr
-        mat = pymupdf.Matrix(zf, zf)  # zoom matrix
-        fitzpix: pymupdf.Pixmap = page_dlist.get_pixmap(alpha=0, matrix=mat)
-        return fitzpix
-    
     def setAnnotations(self, annotations: dict):
+        """Highlight the quads {pno: [pymupdf.Quad]} over the pages, without re-rendering them"""
         self.annotations.clear()
         self.annotations.update(annotations)
 
+        for item in self.highlight_items.values():
+            self.doc_scene.removeItem(item)
+        self.highlight_items.clear()
+
+        pnos = self.displayedPages()
+        for pno in pnos:
+            self.renderHighlights(pno)
+        self.updateGraphicItems(pnos)
+
+    def addAnnotations(self, annotations: dict):
+        """Highlight more quads {pno: [pymupdf.Quad]}, replacing those of the same pages"""
+        pnos = self.displayedPages()
+        for pno, quads in annotations.items():
+            self.annotations[pno] = quads
+            item = self.highlight_items.pop(pno, None)
+            if item is not None:
+                self.doc_scene.removeItem(item)
+            if pno in pnos:
+                self.renderHighlights(pno)
+        self.updateGraphicItems(pnos)
+
+    def displayedPages(self) -> set[int]:
+        if self.isContinuous():
+            return set(self.page_items)
+        if self._shown_job is not None:
+            return {self._shown_job.pno}
+        return set()
+
+    def pageLayer(self, pno: int) -> PageLayer:
+        """Parent item of the items of the page pno, created hidden"""
+        layer = self.page_layers.get(pno)
+        if layer is None:
+            layer = PageLayer(pno)
+            layer.setVisible(False)
+            self.doc_scene.addItem(layer)
+            self.page_layers[pno] = layer
+        return layer
+
+    def clearPageLayers(self):
+        for layer in self.page_layers.values():
+            self.doc_scene.removeItem(layer)
+        self.page_layers.clear()
+        self._shown_layers.clear()
+        self.link_layers.clear()
+        self.page_links.clear()
+        self.highlight_items.clear()
+        self.page_glyphs.clear()
+        self.graphic_items = {}
+
+    def releasePageLayer(self, pno: int):
+        """
+            Remove the link and highlight items of a page no longer shown, and its layer unless
+            it holds annotations. The link geometry is kept in page_links.
+        """
+        link_layer = self.link_layers.pop(pno, None)
+        if link_layer is not None:
+            self.doc_scene.removeItem(link_layer)
+        highlight = self.highlight_items.pop(pno, None)
+        if highlight is not None:
+            self.doc_scene.removeItem(highlight)
+
+        current = self._current_graphic_item
+        if self.graphic_items.get(pno) or (current is not None and current.pno == pno):
+            layer = self.page_layers.get(pno)
+            if layer is not None:
+                layer.setVisible(False)
+            return
+        layer = self.page_layers.pop(pno, None)
+        if layer is not None:
+            self.doc_scene.removeItem(layer)
+
+    def renderHighlights(self, pno: int):
+        quads = self.annotations.get(pno)
+        if quads and pno not in self.highlight_items:
+            item = HighlightItem(quads, pno)
+            self.pageLayer(pno).addItem(item)
+            self.highlight_items[pno] = item
+
     def renderLinks(self, pno: int):
-        boxes: list = self.link_boxes.get(pno)
+        if pno in self.link_layers:
+            return
 
-        if boxes is None:
-            boxes: list = []
-            page = self.fitzdoc[pno]
-            for link in page.links([pymupdf.LINK_GOTO, pymupdf.LINK_NAMED]):
-                linkbox = LinkBox(link, pno, self.zoomSelector().zoomFactor)
-                linkbox.sigJumpTo.connect(self.onLinkClicked)
-                self.doc_scene.addItem(linkbox)
-                boxes.append(linkbox)
-            self.link_boxes[pno] = boxes
+        links = self.page_links.get(pno)
+        if links is None:
+            links = PageLinks(self.fitzdoc[pno])
+            self.page_links[pno] = links
+        layer = LinkLayer(links)
+        layer.sigJumpTo.connect(self.onLinkClicked)
+        self.pageLayer(pno).addItem(layer)
+        self.link_layers[pno] = layer
     
     def renderPage(self, pno: int = 0):
         """
-            Render the image
-            Convert the pymupdf Displaylist to QPixmap
+            Display the page from the page cache or request its rendering
+            The current pixmap stays displayed until the new one is delivered to onPageRendered
         """
-        page_dlist: pymupdf.DisplayList = self.dlist[pno]
+        if self.isContinuous():
+            self.renderContinuous(pno)
+            self.prefetcher.pageChanged(pno)
+            return
 
-        if not page_dlist :  # create if not yet there
-            fitzpage = self.fitzdoc.load_page(pno)
-            self.dlist[pno] = fitzpage.get_displaylist()
-            page_dlist = self.dlist[pno]
+        job = self.createRenderJob(pno)
 
-        # Remove annotations
-        page = self.fitzdoc.load_page(pno)
-        self.fitzdoc.xref_set_key(page.xref, "Annots", "null")    
+        # Keep the visible page and its neighbours' DisplayLists
+        self.render_scheduler.displayListCache().pin(range(pno - 1, pno + 2))
 
-        add_annotations = self.annotations.get(pno)
-        if add_annotations is not None:
+        pixmap = self.page_cache.get(job.key())
+        if pixmap is not None:
+            self.render_scheduler.cancel()
+            self._rendering = None
+            self.showPage(job, pixmap)
+        else:
+            self._rendering = self.render_scheduler.render(job)
+            self.showPreview(job)
 
-            quads: pymupdf.Quad
-            for quads in add_annotations:
-                page.add_highlight_annot(quads)
-            page_dlist = page.get_displaylist()
+        self.prefetcher.pageChanged(pno)
 
-        fitzpix = self.createFitzpix(page_dlist, self._zoom_selector.zoomFactor)
-        pixmap = self.toQPixmap(fitzpix)
-        self.page_pixmap_item.setPixmap(pixmap)
+    def showPreview(self, job: RenderJob):
+        """
+            Show the page at the requested zoom while the sharp render is in flight,
+            scaling the cached render of the nearest zoom or the displayed pixmap
+        """
+        nearest = self.page_cache.nearest(job.key())
+        if nearest is not None:
+            key, pixmap = nearest
+            self.showPage(replace(job, zoom=key[1]), pixmap, preview=True)
+        elif self._shown_job is not None and self._shown_job.pno == job.pno:
+            self.showPage(self._shown_job, self.page_pixmap_item.pixmap(), preview=True)
+
+    def createRenderJob(self, pno: int) -> RenderJob:
+        """
+            Return the RenderJob of the page at the current zoom
+            Pages rendered in tiles get a lower resolution preview instead
+        """
+        zoom = self._zoom_selector.zoomFactor
+
+        if self.isTiled(pno, zoom):
+            rect = self.pageRect(pno)
+            zoom = min(zoom, math.sqrt(self.tile_backdrop_pixels / (rect.width * rect.height)) / self.dpr)
+
+        return RenderJob(pno, zoom, self.dpr)
+
+    def pageRect(self, pno: int) -> pymupdf.Rect:
+        return self.page_sizes.rect(pno)
+
+    def pageOffset(self, pno: int) -> QPointF:
+        """Scene position of the page top-left corner"""
+        if not self.isContinuous() or not self._page_tops:
+            return QPointF()
+        x = (self._layout_width - self.pageRect(pno).width * self._layout_zoom) / 2
+        return QPointF(x, self._page_tops[pno])
+
+    def pageAt(self, position: QPointF) -> int:
+        """Page number under the scene position"""
+        if not self.isContinuous() or not self._page_tops:
+            return self.pageNavigator().currentPno()
+        return max(0, bisect.bisect_right(self._page_tops, position.y()) - 1)
+
+    def layoutPages(self):
+        """Stack the pages at the current zoom and size the scene accordingly"""
+        zoom = self._zoom_selector.zoomFactor
+        rects = self.page_sizes.rects()
+
+        self._page_tops = []
+        y = 0.0
+        for rect in rects:
+            self._page_tops.append(y)
+            y += rect.height * zoom + self.page_spacing
+
+        self._layout_zoom = zoom
+        self._layout_width = max((rect.width for rect in rects), default=0) * zoom
+        self._visible_pages = ()
+        self.doc_scene.setSceneRect(0, 0, self._layout_width, max(0.0, y - self.page_spacing))
+
+    def renderContinuous(self, pno: int):
+        """Lay out the pages if the zoom changed and bring the page in view"""
+        if self._layout_zoom != self._zoom_selector.zoomFactor:
+            # keep the same relative position in the current page
+            fraction = 0.0
+            if self._layout_zoom is not None:
+                visible = self.mapToScene(self.viewport().rect()).boundingRect()
+                page_height = self.pageRect(pno).height * self._layout_zoom
+                fraction = (visible.top() - self._page_tops[pno]) / page_height
+            self.layoutPages()
+            self.scrollToPage(pno, fraction * self.pageRect(pno).height * self._layout_zoom)
+        elif not self._tracking_scroll:
+            self.scrollToPage(pno)
+        self.updateVisiblePages()
+
+    def scrollToPage(self, pno: int, y: float = 0.0):
+        """Scroll the continuous layout so that y (scene units, relative to the page top) is at the top of the viewport"""
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        self._scrolling_to_page = True
+        self.centerOn(visible.center().x(), self._page_tops[pno] + y + visible.height() / 2)
+        self._scrolling_to_page = False
 
-        self.renderLinks(pno)
+    @Slot()
+    def onViewportChanged(self):
+        if self.isZooming():
+            return  # updated at the final zoom by commitZoom
+        if self.isContinuous():
+            self.updateVisiblePages()
+        self.updateTiles()
+
+    def updateVisiblePages(self):
+        """
+            Keep pixmap items only for the pages intersecting the viewport plus half a viewport
+            of margin, recycling the others, and request the missing renders
+        """
+        if not self._page_tops:
+            return
 
-        # Show/Hide/Transform graphic annotation items
-        items = self.doc_scene.items()
-        for item in items:
-            if isinstance(item, QGraphicsPixmapItem):
-                continue
-            elif isinstance(item, QGraphicsLineItem):
+        zoom = self._zoom_selector.zoomFactor
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        margin = visible.height() / 2
+        first = max(0, bisect.bisect_right(self._page_tops, visible.top() - margin) - 1)
+        last = min(self.page_count - 1, bisect.bisect_right(self._page_tops, visible.bottom() + margin) - 1)
+        wanted = range(first, last + 1)
+
+        for pno in list(self.page_items):
+            if pno not in wanted:
+                self.releasePageItem(pno)
+
+        missing: list[RenderJob] = []
+        for pno in wanted:
+            job = self.createRenderJob(pno)
+            if self._page_item_keys.get(pno) == job.key():
                 continue
-            elif item.pno == pno:
+
+            item = self.page_items.get(pno)
+            if item is None:
+                item = self._page_item_pool.pop() if self._page_item_pool else self.createPixmapItem()
+                item.setZValue(-2)
                 item.setVisible(True)
-                item.setScale(self.zoomSelector().zoomFactor / item.zfactor)
+                if item.scene() is None:
+                    self.doc_scene.addItem(item)
+                self.page_items[pno] = item
+                self.renderLinks(pno)
+                self.renderHighlights(pno)
+
+            pixmap = self.page_cache.get(job.key())
+            if pixmap is not None:
+                self.setPageItemPixmap(job, pixmap)
+                continue
+
+            nearest = self.page_cache.nearest(job.key())
+            if nearest is not None:
+                key, pixmap = nearest
+                self.setPageItemPixmap(replace(job, zoom=key[1]), pixmap, preview=True)
             else:
-                item.setVisible(False)
+                item.setPixmap(QPixmap())
+                self._page_item_keys.pop(pno, None)
+            missing.append(job)
+
+        if not {job.key() for job in missing} <= self._pending_pages:
+            self.render_scheduler.renderPages(missing)
+            self._pending_pages = {job.key() for job in missing}
+
+        if self._visible_pages != (first, last, zoom):
+            self._visible_pages = (first, last, zoom)
+            self.render_scheduler.displayListCache().pin(wanted)
+            self.updateGraphicItems(set(wanted))
+
+        # The current page is the one at the top of the viewport
+        if not self._scrolling_to_page:
+            pno = max(0, bisect.bisect_right(self._page_tops, visible.top() + 1) - 1)
+            if pno != self.pageNavigator().currentPno():
+                self._tracking_scroll = True
+                self.pageNavigator()._setCurrentPno(pno)
+                self._tracking_scroll = False
+
+    def setPageItemPixmap(self, job: RenderJob, pixmap: QPixmap, preview: bool = False):
+        item = self.page_items[job.pno]
+        item.setPixmap(pixmap)
+        item.setPos(self.pageOffset(job.pno))
+        item.setScale(self._zoom_selector.zoomFactor / job.zoom)
+        if preview:
+            self._page_item_keys.pop(job.pno, None)
+        else:
+            self._page_item_keys[job.pno] = job.key()
+
+    def releasePageItem(self, pno: int):
+        item = self.page_items.pop(pno)
+        self._page_item_keys.pop(pno, None)
+        item.setPixmap(QPixmap())
+        item.setVisible(False)
+        self._page_item_pool.append(item)
+
+    def releasePageItems(self):
+        for pno in list(self.page_items):
+            self.releasePageItem(pno)
+        self._pending_pages.clear()
+        self._visible_pages = ()
+        self._page_tops = []
+
+    def isTiled(self, pno: int, zoom: float) -> bool:
+        """True if the page at this zoom is too large to be rasterized at once"""
+        rect = self.pageRect(pno)
+        zf = zoom * self.dpr
+        return rect.width * rect.height * zf * zf > self.tile_threshold
+
+    @staticmethod
+    def zoomBucket(zoom: float) -> float:
+        return zoomBucket(zoom)
+
+    def createTileJob(self, pno: int, bucket: float, tile: tuple) -> RenderJob:
+        step = self.tile_size / (bucket * self.dpr)  # tile size in page units
+        rect = self.pageRect(pno)
+        column, row = tile
+        clip = (rect.x0 + column * step, rect.y0 + row * step,
+                min(rect.x1, rect.x0 + (column + 1) * step), min(rect.y1, rect.y0 + (row + 1) * step))
+        return RenderJob(pno, bucket, self.dpr, clip=clip, tile=tile)
+
+    @Slot()
+    def updateTiles(self):
+        """Show the tiles intersecting the viewport plus a margin and request the missing ones"""
+        if self.isContinuous():
+            pno = self.pageNavigator().currentPno() if self._page_tops else None
+        else:
+            pno = self._shown_job.pno if self._shown_job is not None else None
+
+        if pno is None:
+            self.clearTiles()
+            return
+
+        zoom = self._zoom_selector.zoomFactor
+
+        if not self.isTiled(pno, zoom):
+            self.clearTiles()
+            return
+
+        bucket = self.zoomBucket(zoom)
+        if self._tiles_key != (pno, bucket):
+            self.clearTiles()
+            self._tiles_key = (pno, bucket)
+
+        rect = self.pageRect(pno)
+        step = self.tile_size / (bucket * self.dpr)
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        visible.translate(-self.pageOffset(pno))
+        columns = range(max(0, int(visible.left() / zoom // step) - 1),
+                        min(math.ceil(rect.width / step), int(visible.right() / zoom // step) + 2))
+        rows = range(max(0, int(visible.top() / zoom // step) - 1),
+                     min(math.ceil(rect.height / step), int(visible.bottom() / zoom // step) + 2))
+        wanted = {(column, row) for column in columns for row in rows}
+
+        for tile in list(self.tile_items):
+            if tile not in wanted:
+                self.doc_scene.removeItem(self.tile_items.pop(tile))
+
+        missing: list[RenderJob] = []
+        for tile in wanted:
+            job = self.createTileJob(pno, bucket, tile)
+            item = self.tile_items.get(tile)
+            if item is not None:
+                self.placeTile(item, job)
+                continue
+
+            pixmap = self.tile_cache.get(job.key())
+            if pixmap is not None:
+                self.showTile(job, pixmap)
+            else:
+                missing.append(job)
+
+        if not {job.tile for job in missing} <= self._pending_tiles:
+            self.render_scheduler.renderTiles(missing)
+            self._pending_tiles = {job.tile for job in missing}
+
+    def showTile(self, job: RenderJob, pixmap: QPixmap):
+        item = self.createPixmapItem(pixmap)
+        item.setZValue(-1)
+        self.placeTile(item, job)
+        self.doc_scene.addItem(item)
+        self.tile_items[job.tile] = item
+
+    def placeTile(self, item: QGraphicsPixmapItem, job: RenderJob):
+        zoom = self._zoom_selector.zoomFactor
+        rect = self.pageRect(job.pno)
+        item.setPos(self.pageOffset(job.pno) + QPointF((job.clip[0] - rect.x0) * zoom, (job.clip[1] - rect.y0) * zoom))
+        item.setScale(zoom / job.zoom)
+
+    def clearTiles(self):
+        if self._tiles_key is None:
+            return
+        for item in self.tile_items.values():
+            self.doc_scene.removeItem(item)
+        self.tile_items.clear()
+        self._tiles_key = None
+        self._pending_tiles.clear()
+        self.render_scheduler.cancel(RenderJob.Kind.TILE)
+
+    @Slot(object, object)
+    def onPageRendered(self, job: RenderJob, image: QImage):
+        """Cache and display the rendered page or tile"""
+        stats = self.render_scheduler.stats
+        with stats.timed("to_qpixmap"):
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(job.dpr)
+
+        with stats.timed("scene_update"):
+            self.displayRendered(job, pixmap)
+        self.sigRenderStats.emit(stats)
+
+    def displayRendered(self, job: RenderJob, pixmap: QPixmap):
+        if job.kind == RenderJob.Kind.TILE:
+            self.tile_cache.insert(job.key(), pixmap)
+            self._pending_tiles.discard(job.tile)
+            if self._tiles_key == (job.pno, job.zoom) and job.tile not in self.tile_items:
+                self.showTile(job, pixmap)
+            return
+
+        self.page_cache.insert(job.key(), pixmap)
+
+        if self.isContinuous():
+            self._pending_pages.discard(job.key())
+            if job.pno in self.page_items and job.key() == self.createRenderJob(job.pno).key():
+                self.setPageItemPixmap(job, pixmap)
+            return
+
+        if job is not self._rendering:
+            return
+        self._rendering = None
+        self.showPage(job, pixmap)
+
+    def showPage(self, job: RenderJob, pixmap: QPixmap, preview: bool = False):
+        """Display the pixmap rendered for job, scaled to the current zoom"""
+        zoom = self._zoom_selector.zoomFactor
+        # Another page or zoom is centered, a sharper render of the same one keeps the scroll position
+        recenter = self._shown_job is None or self._shown_job.pno != job.pno or self._shown_zoom != zoom
+        self.page_pixmap_item.setPixmap(pixmap)
+        self.page_pixmap_item.setScale(zoom / job.zoom)
+        self._shown_job = job
+        self._shown_zoom = zoom
+
+        self.renderLinks(job.pno)
+        self.renderHighlights(job.pno)
+        self.updateGraphicItems({job.pno})
                 
-        self.centerOn(self.page_pixmap_item)
+        if recenter:
+            self.centerOn(self.page_pixmap_item)
         self.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignCenter)
-        self.doc_scene.setSceneRect(self.page_pixmap_item.boundingRect()) 
+        self.doc_scene.setSceneRect(self.page_pixmap_item.sceneBoundingRect()) 
+
+        if self._scroll_to is not None:
+            self.verticalScrollBar().setValue(self._scroll_to)
+            if not preview:
+                self._scroll_to = None
+
+        self.updateTiles()
         self.viewport().update()
 
+    def updateGraphicItems(self, pnos: set[int]):
+        """Show the item layers of the pages pnos, placed and scaled with the pages, and release the others"""
+        zoom = self._zoom_selector.zoomFactor
+        for pno in self._shown_layers - pnos:
+            self.releasePageLayer(pno)
+
+        for pno in pnos:
+            layer = self.pageLayer(pno)
+            layer.setPos(self.pageOffset(pno))
+            layer.setScale(zoom)
+            layer.setVisible(True)
+        self._shown_layers = set(pnos)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.onViewportChanged()
+
     @Slot()
     def setRotation(self, degree):
         """Rotate current page"""
@@ -761,23 +3477,34 @@ class PdfView(QGraphicsView):
         elif event.key() == Qt.Key.Key_Right:
             self.next()
 
+    def viewportEvent(self, event: QEvent) -> bool:
+        # Pinch: gesture on touch screens, native gesture on trackpads
+        if event.type() == QEvent.Type.Gesture:
+            pinch = event.gesture(Qt.GestureType.PinchGesture)
+            if isinstance(pinch, QPinchGesture):
+                if pinch.changeFlags() & QPinchGesture.ChangeFlag.ScaleFactorChanged:
+                    anchor = self.viewport().mapFromGlobal(pinch.centerPoint().toPoint())
+                    self.previewZoom(self.zoomTarget() * pinch.scaleFactor(), anchor)
+                event.accept(pinch)
+                return True
+        elif (event.type() == QEvent.Type.NativeGesture
+                and event.gestureType() == Qt.NativeGestureType.ZoomNativeGesture):
+            self.previewZoom(self.zoomTarget() * (1.0 + event.value()), event.position().toPoint())
+            return True
+        return super().viewportEvent(event)
+
+    def zoomTarget(self) -> float:
+        """Zoom factor shown, previewed or rendered"""
+        return self._pending_zoom if self._pending_zoom is not None else self._zoom_selector.zoomFactor
+
     def wheelEvent(self, event: QWheelEvent) -> None:
-        #Zoom : CTRL + wheel
+        #Zoom : CTRL + wheel, a notch of 120 is one zoom step, trackpads send fractions of it
         modifiers = QApplication.keyboardModifiers()
         if modifiers == Qt.KeyboardModifier.ControlModifier:
-            anchor = self.transformationAnchor()
-            self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
-            if event.angleDelta().y() > 0:
-                self._zoom_selector.zoomIn()
-            else:
-                self._zoom_selector.zoomOut()
-            while self._zoom_selector.zoomFactor >= self._zoom_selector.max_zoom_factor:
-                self._zoom_selector.zoomOut()
-            while self._zoom_selector.zoomFactor < self._zoom_selector.min_zoom_factor:
-                self._zoom_selector.zoomIn()
-            self.renderPage(self.pageNavigator().currentPno())
-            self.setTransformationAnchor(anchor)
-            # self.doc_view.centerOn(self.doc_view.mapFromGlobal(pointer_position))
+            step = event.angleDelta().y() / 120 * ZoomSelector.zoom_factor_step
+            self.previewZoom(self.zoomTarget() + step, event.position().toPoint())
+        elif self.isContinuous():
+            self.verticalScrollBar().setValue(self.verticalScrollBar().sliderPosition() - event.angleDelta().y())
         else:
             # Scroll Down
             if event.angleDelta().y() < 0 and self.verticalScrollBar().sliderPosition() == self.verticalScrollBar().maximum():
@@ -799,24 +3526,53 @@ class PdfView(QGraphicsView):
         return self.fitzdoc.load_page(self.pageNavigator().currentPno())
 
     def loadGraphicItems(self, d: dict):
+        """Set the annotation items {pno: {id: item}} and attach them to their page layers"""
         self.graphic_items = d
+        for pno, items in d.items():
+            for item in items.values():
+                self.pageLayer(pno).addItem(item)
+        self.updateGraphicItems(self.displayedPages())
 
     def getGraphicItems(self) -> dict:
         return self.graphic_items
     
+    def pageGlyphs(self, pno: int) -> PageGlyphs:
+        """Character boxes of the page, kept for the last glyph_pages pages"""
+        glyphs = self.page_glyphs.get(pno)
+        if glyphs is None:
+            glyphs = PageGlyphs(*self.text_cache.get(pno))
+            self.page_glyphs[pno] = glyphs
+            while len(self.page_glyphs) > self.glyph_pages:
+                self.page_glyphs.popitem(last=False)
+        else:
+            self.page_glyphs.move_to_end(pno)
+        return glyphs
+
+    def caretAt(self, pno: int, position: QPointF) -> int:
+        """Caret of the page pno nearest to the scene position"""
+        point = (position - self.pageOffset(pno)) / self._zoom_selector.zoomFactor
+        return self.pageGlyphs(pno).caretAt(point.x(), point.y())
+
     def getSelection(self, pno: int, a0: QPointF, b1: QPointF) -> TextSelection:
-        """Return TextSelection from selection points"""
-        page: pymupdf.Page = self.fitzdoc.load_page(pno)
-        zf = self._zoom_selector.zoomFactor
-        rect = pymupdf.Rect(a0.x() / zf, a0.y() / zf, b1.x() / zf, b1.y() / zf)
-        text_selection = TextSelection()
-        text_selection.text = page.get_textbox(rect)
+        """Return TextSelection of the text from a0 to b1 in reading order, scene positions on page pno"""
+        glyphs = self.pageGlyphs(pno)
+        a, b = self.caretAt(pno, a0), self.caretAt(pno, b1)
+        text_selection = TextSelection(glyphs.selectedText(a, b))
+        text_selection.quads = glyphs.selectedQuads(a, b)
         return text_selection
     
     @Slot(QPointF)
     def scrollTo(self, location: QPointF | int):
         if isinstance(location, QPointF):
             location = location.toPoint().y()
+
+        if self.isContinuous():
+            if self._page_tops:
+                self.scrollToPage(self.pageNavigator().currentPno(), location)
+            return
+
+        if self._rendering is not None:
+            self._scroll_to = location
         self.verticalScrollBar().setValue(location)
 
     @Slot(int)
@@ -833,14 +3589,12 @@ class PdfView(QGraphicsView):
         self.cursor_position = event.position()
 
         if self._current_graphic_item is not None:
-            r = QRectF(self.a0, self.mapToScene(event.position().toPoint())).normalized()
-            self._current_graphic_item.setRect(r)
-            self.update()
+            self.updateMouseInteraction(self.mapToScene(event.position().toPoint()))
         self.sig_mouse_position.emit(self.mapToScene(event.position().toPoint()))
         return super().mouseMoveEvent(event)
     
     def mouseReleaseEvent(self, event):
-        self.b1: QPointF = self.mapToScene(self.cursor_position.toPoint())
+        self.b1: QPointF = self.mapToScene(event.position().toPoint())
         
         if self._current_graphic_item is not None:
             self.endMouseInteraction()
@@ -849,22 +3603,37 @@ class PdfView(QGraphicsView):
     
     def startMouseInteraction(self):
         if self.mouse_interaction.interaction == MouseInteraction.InteractionType.TEXTSELECTION:
-            self._current_graphic_item = RectItem()
-            self._current_graphic_item.setPen(QPen(Qt.GlobalColor.red))
-            r = QRectF(self.a0, self.a0)
-            self._current_graphic_item.setRect(r)
-            self._current_graphic_item.pno = self.pageNavigator().currentPno()
-            self._current_graphic_item.zfactor = self.zoomSelector().zoomFactor
-            self.doc_scene.addItem(self._current_graphic_item)
+            pno = self.pageAt(self.a0)
+            self._current_graphic_item = SelectionItem(pno)
+            self.pageLayer(pno).addItem(self._current_graphic_item)
+            self._selection_anchor = self._selection_caret = self.caretAt(pno, self.a0)
+            self.setDragMode(QGraphicsView.DragMode.NoDrag)  # no rubber band over the selection
+
+    def updateMouseInteraction(self, position: QPointF):
+        """Extend the text selection to the caret under the scene position"""
+        if isinstance(self._current_graphic_item, SelectionItem):
+            pno = self._current_graphic_item.pno
+            caret = self.caretAt(pno, position)
+            if caret != self._selection_caret:
+                self._selection_caret = caret
+                self._current_graphic_item.setRects(self.pageGlyphs(pno).selectedRects(self._selection_anchor, caret))
 
     def endMouseInteraction(self):
-        self._current_graphic_item.text = self.getSelection(self.pageNavigator().currentPno(), self.a0, self.b1)
+        pno = self._current_graphic_item.pno
+        if isinstance(self._current_graphic_item, SelectionItem):
+            self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
+            self.updateMouseInteraction(self.b1)
+            if self._selection_anchor == self._selection_caret:  # a click, nothing selected
+                self.doc_scene.removeItem(self._current_graphic_item)
+                self._current_graphic_item = None
+                return
+        self._current_graphic_item.text = self.getSelection(pno, self.a0, self.b1)
 
         # save graphics
-        if self._page_navigator.currentPno() in self.graphic_items:
-            self.graphic_items[self._page_navigator.currentPno()].update({id(self._current_graphic_item) : self._current_graphic_item})
+        if pno in self.graphic_items:
+            self.graphic_items[pno].update({id(self._current_graphic_item) : self._current_graphic_item})
         else:
-            self.graphic_items[self._page_navigator.currentPno()] = {id(self._current_graphic_item) : self._current_graphic_item}
+            self.graphic_items[pno] = {id(self._current_graphic_item) : self._current_graphic_item}
 
         self.sig_annotation_added.emit(self._current_graphic_item)
 
@@ -874,7 +3643,7 @@ class PdfView(QGraphicsView):
         if event == QKeySequence.StandardKey.Delete:
             items = self.doc_scene.selectedItems()
             for item in items:
-                self.graphic_items[self._page_navigator.currentPno()].pop(id(item))
+                self.graphic_items[item.pno].pop(id(item))
                 self.sig_annotation_removed.emit(id(item))
                 self.doc_scene.removeItem(item)
 
@@ -903,14 +3672,38 @@ class PdfViewer(QWidget):
             return
         
         self._filepath = filepath
-        self.fitzdoc: pymupdf.Document = pymupdf.Document(filepath)
-        self.pdfview.setDocument(self.fitzdoc)
+        self.setDocument(pymupdf.Document(filepath), filepath)
+
+    def loadStream(self, stream, filetype: str = ""):
+        """
+            Load a document from memory: bytes, bytearray, memoryview, mmap, io.BytesIO or a file object.
+            The content is not copied and must not change while the document is open.
+            filetype, e.g. "pdf" or "epub", is detected from the content when empty.
+        """
+        buffer = streamBuffer(stream)
+        self._filepath = None
+        self.setDocument(pymupdf.Document(stream=buffer, filetype=filetype or None), buffer)
+
+    def setDocument(self, doc: pymupdf.Document, source: DocumentSource = ""):
+        """Show doc, source is the file path or buffer it was opened from, used by the disk caches"""
+        self.fitzdoc: pymupdf.Document = doc
+        fingerprint = None
+        if source:
+            try:
+                fingerprint = documentFingerprint(source)
+            except OSError as e:
+                logger.error(f"Cannot fingerprint {doc.name}: {e}")
+                source = ""
+        self.pdfview.setDocument(self.fitzdoc, source, fingerprint)
         self.outline_model.setDocument(self.fitzdoc)
-        self.search_model.setDocument(self.fitzdoc)
+        self.search_model.setDocument(self.fitzdoc, source, fingerprint)
+        self.thumbnail_model.setDocument(self.fitzdoc, source, fingerprint)
+        self.link_model.setDocument(self.fitzdoc)
         self.metadata_tab.setMetadata(self.fitzdoc.metadata)
 
     def initViewer(self):
         self.fold = False
+        self._syncing_outline = False
         vbox = QVBoxLayout()
 
         self.toolbar = QToolBar(self)
@@ -918,7 +3711,11 @@ class PdfViewer(QWidget):
 
         self.pdfview = PdfView(self)
         self.outline_model = OutlineModel()
-        self.search_model = SearchModel()
+        self.search_model = SearchModel(self)
+        self.thumbnail_model = ThumbnailModel(self)
+        self.thumbnail_model.setDocumentLock(self.pdfview.render_scheduler.displayListCache().lock())
+        self.link_model = LinkModel(self)
+        self.link_model.setTextPageCache(self.pdfview.textPageCache())
 
         # --- Toolbar ---
         self.mouse_action_group = QActionGroup(self)
@@ -967,6 +3764,12 @@ class PdfViewer(QWidget):
         self.rotate_clockwise.setToolTip("Rotate clockwise")
         self.rotate_clockwise.triggered.connect(lambda: self.pdfview.setRotation(90))
 
+        # Continuous scroll
+        self.continuous_scroll = QAction("Continuous", self)
+        self.continuous_scroll.setToolTip("Continuous scroll")
+        self.continuous_scroll.setCheckable(True)
+        self.continuous_scroll.toggled.connect(self.onContinuousScrollToggled)
+
         # Collapse Left pane
         self.fold_left_pane = QAction(theme_icon_manager.get_icon(':sidebar-fold-line'), "Fold pane", self, triggered=self.onFoldLeftSidebarTriggered)
 
@@ -983,6 +3786,7 @@ class PdfViewer(QWidget):
         self.toolbar.addAction(zoom_out)
         self.toolbar.addAction(self.rotate_anticlockwise)
         self.toolbar.addAction(self.rotate_clockwise)
+        self.toolbar.addAction(self.continuous_scroll)
         spacer = QWidget(self)
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.toolbar.addWidget(spacer)
@@ -1001,9 +3805,31 @@ class PdfViewer(QWidget):
         self.outline_tab.setModel(self.outline_model)
         self.outline_tab.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.outline_tab.setHeaderHidden(True)
+        self.outline_tab.setUniformRowHeights(True)
         self.outline_tab.selectionModel().selectionChanged.connect(self.onOutlineSelected)
         self.left_pane.addTab(self.outline_tab, "Outline")
 
+        # Thumbnails Tab
+        self.thumbnail_tab = QListView(self.left_pane)
+        self.thumbnail_tab.setModel(self.thumbnail_model)
+        self.thumbnail_tab.setViewMode(QListView.ViewMode.IconMode)
+        self.thumbnail_tab.setFlow(QListView.Flow.TopToBottom)
+        self.thumbnail_tab.setWrapping(False)
+        self.thumbnail_tab.setMovement(QListView.Movement.Static)
+        self.thumbnail_tab.setUniformItemSizes(True)
+        self.thumbnail_tab.setIconSize(QSize(ThumbnailModel.thumbnail_size, ThumbnailModel.thumbnail_size))
+        self.thumbnail_tab.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.thumbnail_tab.clicked.connect(lambda index: self.page_navigator.jump(index.row()))
+        self.left_pane.addTab(self.thumbnail_tab, "Thumbnails")
+
+        # Links Tab
+        self.links_tab = QListView(self.left_pane)
+        self.links_tab.setModel(self.link_model)
+        self.links_tab.setUniformItemSizes(True)
+        self.links_tab.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.links_tab.clicked.connect(self.onLinkSelected)
+        self.left_pane.addTab(self.links_tab, "Links")
+
         # Search Tab
         search_tab = QWidget(self.left_pane)
         search_tab_layout = QVBoxLayout()
@@ -1014,6 +3840,19 @@ class PdfViewer(QWidget):
         self.search_LineEdit.editingFinished.connect(self.searchFor)
         
         self.search_count = QLabel("Hits: ")
+        self.search_progress = QLabel()
+
+        self.search_stop = QToolButton()
+        self.search_stop.setText("Stop")
+        self.search_stop.setToolTip("Stop search")
+        self.search_stop.setEnabled(False)
+        self.search_stop.clicked.connect(self.stopSearch)
+
+        search_status_layout = QHBoxLayout()
+        search_status_layout.addWidget(self.search_count)
+        search_status_layout.addWidget(self.search_progress)
+        search_status_layout.addStretch()
+        search_status_layout.addWidget(self.search_stop)
 
         self.search_results = QTreeView(self.left_pane)
         self.search_results.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)  # Make ReadOnly
@@ -1023,7 +3862,7 @@ class PdfViewer(QWidget):
         self.search_results.selectionModel().selectionChanged.connect(self.onSearchResultSelected)
 
         search_tab_layout.addWidget(self.search_LineEdit)
-        search_tab_layout.addWidget(self.search_count)
+        search_tab_layout.addLayout(search_status_layout)
         search_tab_layout.addWidget(self.search_results)
         self.left_pane.addTab(search_tab, "Search")
 
@@ -1033,6 +3872,9 @@ class PdfViewer(QWidget):
         self.pdfview.sig_mouse_position.connect(self.updateMousePositionLabel)
         self.metadata_tab = MetaDataWidget(self.left_pane)
         self.metadata_tab.layout().insertWidget(1, self.mouse_position)
+        self.render_stats_label = QLabel()  # debug overlay of the render stats
+        self.render_stats_label.setVisible(False)
+        self.metadata_tab.layout().insertWidget(2, self.render_stats_label)
         self.left_pane.addTab(self.metadata_tab, "Metadata")
 
         # Splitter
@@ -1048,6 +3890,12 @@ class PdfViewer(QWidget):
         
         # Signals
         self.search_model.sigTextFound.connect(self.onSearchFound)
+        self.page_navigator.currentPnoChanged.connect(self.syncOutline)
+        self.page_navigator.currentPnoChanged.connect(self.syncThumbnails)
+        self.search_model.sigPageFound.connect(self.onSearchPageFound)
+        self.search_model.sigSearchProgress.connect(self.onSearchProgress)
+        self.search_model.setStats(self.pdfview.renderStats())
+        self.search_model.setTextPageCache(self.pdfview.textPageCache())
 
         self.installEventFilter(self.pdfview)
 
@@ -1073,10 +3921,21 @@ class PdfViewer(QWidget):
     @Slot(str)
     def onSearchFound(self, count: str):
         self.search_count.setText(count)
-        self.pdfview.setAnnotations(self.search_model.getSearchResults())
-        self.pdfview.renderPage(self.page_navigator.currentPno())
+        self.search_stop.setEnabled(False)
         self.search_results.resizeColumnToContents(0)
 
+    @Slot(int)
+    def onSearchPageFound(self, pno: int):
+        self.search_count.setText(f"Hits: {self.search_model.foundCount()}")
+        self.pdfview.addAnnotations({pno: self.search_model.getSearchResults()[pno]})
+
+    @Slot(int, int)
+    def onSearchProgress(self, searched: int, page_count: int):
+        if searched < page_count:
+            self.search_progress.setText(f"{100 * searched // page_count}%")
+        else:
+            self.search_progress.clear()
+
     def pdfViewSize(self) -> QSize:
         idx = self.splitter.indexOf(self.pdfview)
         return self.splitter.widget(idx).size()
@@ -1092,8 +3951,42 @@ class PdfViewer(QWidget):
     
     @Slot()
     def searchFor(self):
-        self.search_model.searchFor(self.search_LineEdit.text())
+        self.pdfview.setAnnotations({})
+        self.search_progress.clear()
+        self.search_model.searchFor(self.search_LineEdit.text(), self.page_navigator.currentPno())
+        self.search_stop.setEnabled(self.search_model.isSearching())
+
+    def renderStatsVisible(self) -> bool:
+        return self.render_stats_label.isVisibleTo(self.metadata_tab)
+
+    def setRenderStatsVisible(self, visible: bool):
+        """Show the render stats under the mouse position debug label"""
+        self.render_stats_label.setVisible(visible)
+        if visible:
+            self.pdfview.sigRenderStats.connect(self.onRenderStats)
+            self.onRenderStats(self.pdfview.renderStats())
+        else:
+            try:
+                self.pdfview.sigRenderStats.disconnect(self.onRenderStats)
+            except TypeError:
+                pass
+
+    @Slot(object)
+    def onRenderStats(self, stats: RenderStats):
+        self.render_stats_label.setText(stats.summary())
+
+    @Slot()
+    def stopSearch(self):
+        self.search_model.stop()
+        self.search_progress.clear()
     
+    @Slot(bool)
+    def onContinuousScrollToggled(self, checked: bool):
+        if checked:
+            self.pdfview.setLayoutMode(PdfView.LayoutMode.Continuous)
+        else:
+            self.pdfview.setLayoutMode(PdfView.LayoutMode.SinglePage)
+
     @Slot()
     def fitwidth(self):
         self.pdfview.setZoomMode(ZoomSelector.ZoomMode.FitToWidth)
@@ -1104,11 +3997,43 @@ class PdfViewer(QWidget):
     
     @Slot(QItemSelection, QItemSelection)
     def onOutlineSelected(self, selected: QItemSelection, deseleted: QItemSelection):
+        if self._syncing_outline:
+            return
+
         for idx in selected.indexes():
-            item: OutlineItem = self.outline_tab.model().itemFromIndex(idx)
-            if item.details is not None:
+            item: OutlineItem = self.outline_model.item(idx)
+            if item.getDetails() is not None and item.page >= 0:
                 self.page_navigator.jump(item.page)
 
+    @Slot(QModelIndex)
+    def onLinkSelected(self, index: QModelIndex):
+        link: GoToLink | NamedLink = self.link_model.link(index)
+        if link.page_to >= 0:
+            self.page_navigator.jump(link.page_to)
+
+    @Slot(int)
+    def syncThumbnails(self, pno: int):
+        index = self.thumbnail_model.index(pno)
+        self.thumbnail_tab.setCurrentIndex(index)
+        self.thumbnail_tab.scrollTo(index)
+
+    @Slot(int)
+    def syncOutline(self, pno: int):
+        """Select the outline entry of the section containing pno"""
+        index = self.outline_model.indexForPage(pno)
+        current = self.outline_model.item(self.outline_tab.currentIndex())
+
+        if not index.isValid():
+            return
+
+        if current is not None and current.page == self.outline_model.item(index).page:
+            return  # keep the entry picked by the user among those starting on the page
+
+        self._syncing_outline = True
+        self.outline_tab.selectionModel().setCurrentIndex(index, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+        self.outline_tab.scrollTo(index)
+        self._syncing_outline = False
+
     @Slot(QItemSelection, QItemSelection)
     def onSearchResultSelected(self, selected: QItemSelection, deseleted: QItemSelection):
         for idx in selected.indexes():
@@ -0,0 +1,60 @@
+"""Pixel parity of drawInBands with DisplayList.get_pixmap"""
+import math
+
+import pymupdf
+
+from pymupdf_qt_viewer.pymupdfviewer import drawInBands
+
+
+def textPage() -> pymupdf.Page:
+    doc = pymupdf.open()
+    page = doc.new_page()
+    for i in range(40):
+        page.insert_text((50, 60 + 18 * i), f"Line {i} of the parity test, some text to draw", fontsize=12)
+    page.draw_rect(pymupdf.Rect(100, 400, 300, 600), color=None, fill=(0.2, 0.4, 0.8))
+    return page
+
+
+def vectorPage() -> pymupdf.Page:
+    doc = pymupdf.open()
+    page = doc.new_page()
+    shape = page.new_shape()
+    for k in range(500):
+        shape.draw_line((k % 590, (k * 7) % 840), ((k * 13) % 590, (k * 3) % 840))
+    shape.finish(color=(0, 0, 0), width=0.5)
+    shape.commit()
+    return page
+
+
+def test_small_render_is_single_call():
+    dlist = vectorPage().get_displaylist()
+    for zoom in (1.0, 1.37, 1.5):
+        matrix = pymupdf.Matrix(zoom, zoom)
+        expected = dlist.get_pixmap(alpha=0, matrix=matrix)
+        fitzpix = drawInBands(dlist, matrix)
+        assert fitzpix.irect == expected.irect
+        assert fitzpix.samples == expected.samples
+
+
+def test_banded_render_matches_get_pixmap():
+    dlist = textPage().get_displaylist()
+    for zoom, clip in ((2.0, None), (3.0, None), (2.5, pymupdf.Rect(40, 50, 400, 700))):
+        matrix = pymupdf.Matrix(zoom, zoom)
+        expected = dlist.get_pixmap(alpha=0, matrix=matrix, clip=clip)
+        fitzpix = drawInBands(dlist, matrix, clip, band_pixels=256 * 1024)
+        assert fitzpix.irect == expected.irect
+        assert fitzpix.samples == expected.samples
+
+
+def test_band_height_is_fixed():
+    dlist = vectorPage().get_displaylist()
+    matrix = pymupdf.Matrix(3, 3)
+    bbox = (dlist.rect * matrix).round()
+    checks = []
+    drawInBands(dlist, matrix, cancelled=lambda: checks.append(1) and False, band_pixels=64 * 1024)
+    assert len(checks) == math.ceil(bbox.height / 256)  # min_rows, wider than band_pixels allows
+
+
+def test_cancelled_returns_none():
+    dlist = textPage().get_displaylist()
+    assert drawInBands(dlist, pymupdf.Matrix(4, 4), cancelled=lambda: True) is None